@@ -13,11 +13,13 @@ if not getattr(sys, 'frozen', False):
         sys.path.insert(0, src_dir)
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from youtubemaster.ui.main_window import MainWindow, ThemeManager
+from youtubemaster.utils.config import config
+from youtubemaster.utils.logger import Logger
 
 # Define a custom signal for receiving URLs
 class SingleInstanceListener(QObject):
@@ -130,6 +132,9 @@ def main():
     # Apply dark theme
     ThemeManager.apply_dark_theme(app)
     
+    # Room for a few hundred scaled queue thumbnails (limit is in KB)
+    QPixmapCache.setCacheLimit(20480)
+    
     # Set application icon - using more robust path resolution
     try:
         # Check if we're running from PyInstaller bundle
@@ -148,6 +153,9 @@ def main():
     except Exception as e:
         print(f"Error setting icon: {str(e)}")
     
+    # Set up logging before any component starts writing to it
+    Logger().setup_logger(config)
+    
     # Create and show main window
     main_window = MainWindow()
     
@@ -4,6 +4,7 @@ Download manager for handling multiple YouTube downloads.
 import os
 import threading
 import time
+from collections import namedtuple
 from typing import Dict, List, Optional, Any, Tuple
 from queue import Queue
 
@@ -16,6 +17,10 @@ from youtubemaster.models.SiteModel import SiteModel
 from youtubemaster.models.PythonDownloadWorker import PythonDownloadWorker
 from youtubemaster.models.CLIDownloadWorker import CLIDownloadWorker
 
+# Everything the queue view needs for one URL, read in a single metadata lookup
+DownloadState = namedtuple('DownloadState', 'status progress title thumbnail output_dir filename')
+_EMPTY_STATE = DownloadState(None, 0, None, None, None, None)
+
 class DownloadManager(QObject):
     """Manager for handling multiple YouTube downloads."""
     
@@ -286,8 +291,12 @@ class DownloadManager(QObject):
         # Start threaded version instead
         self._fetch_quick_metadata_threaded(url)
     
-    def cancel_download(self, url):
-        """Cancel a download or remove a completed download."""
+    def cancel_download(self, url, notify=True):
+        """Cancel a download or remove a completed download.
+        
+        Returns True if the queue changed. With notify=False the caller is
+        responsible for emitting queue_updated and processing the queue.
+        """
         # Prepare variables to store what we need outside the lock
         worker_to_cancel = None
         url_to_cancel = url
@@ -386,10 +395,22 @@ class DownloadManager(QObject):
             self.log_message.emit(f"Removed from queue: {url_to_cancel}")
         
         # Update UI
-        if need_queue_update:
+        if need_queue_update and notify:
             self.queue_updated.emit()
             # Process queue to start new downloads (without holding the lock)
             self._process_queue()
+        
+        return need_queue_update
+    
+    def cancel_downloads(self, urls):
+        """Cancel or remove several downloads, updating the queue only once."""
+        changed = False
+        for url in urls:
+            changed = self.cancel_download(url, notify=False) or changed
+        
+        if changed:
+            self.queue_updated.emit()
+            self._process_queue()
     
     def _cleanup_temp_files(self, output_dir, video_title):
         """Clean up temporary files after a forced termination."""
@@ -446,6 +467,24 @@ class DownloadManager(QObject):
         finally:
             self._mutex.unlock()
     
+    def snapshot(self, url):
+        """Get the status, progress, title, thumbnail and output of a download at once."""
+        metadata = self._metadata.get(url)
+        if metadata is None:
+            return _EMPTY_STATE
+        return DownloadState(
+            metadata['status'],
+            metadata['progress'],
+            metadata['title'],
+            metadata['thumbnail'],
+            metadata.get('output_dir'),
+            metadata.get('filename')
+        )
+    
+    def snapshot_all(self):
+        """Get a {url: DownloadState} dict for every URL, in get_all_urls() order."""
+        return {url: self.snapshot(url) for url in self.get_all_urls()}
+    
     def get_status(self, url):
         """Get the status of a download."""
         if url in self._metadata:
@@ -2,6 +2,8 @@
 Theme Manager for YouTube Master application.
 Centralizes all theme related configuration and styling.
 """
+from functools import lru_cache
+
 from youtubemaster.utils.config import config
 
 class ThemeManager:
@@ -31,15 +33,16 @@ class ThemeManager:
         return config.get('ui.theme.dark.button.text', '#FFFFFF')
     
     @staticmethod
-    def get_toggle_button_style():
-        """Get the complete stylesheet for toggle buttons."""
+    @lru_cache(maxsize=None)
+    def get_toggle_button_style(selector='QPushButton'):
+        """Get the complete stylesheet for toggle buttons matched by selector (built once per selector)."""
         accent_color = ThemeManager.get_accent_color()
         background_color = ThemeManager.get_background_color()
         hover_color = ThemeManager.get_hover_color()
         text_color = ThemeManager.get_text_color()
         
         return f"""
-            QPushButton {{
+            {selector} {{
                 background-color: {background_color};
                 color: {text_color};
                 border: 1px solid #555555;
@@ -48,17 +51,17 @@ class ThemeManager:
                 font-size: 10px;
             }}
             
-            QPushButton:hover {{
+            {selector}:hover {{
                 background-color: {hover_color};
             }}
             
-            QPushButton:checked {{
+            {selector}:checked {{
                 background-color: {accent_color};
                 border: 1px solid {accent_color};
                 color: white;
             }}
             
-            QPushButton:checked:hover {{
+            {selector}:checked:hover {{
                 background-color: {accent_color};
                 border: 1px solid white;
             }}
@@ -2,6 +2,48 @@
 yt-dlp model Encapsulates logic that deals with yt-dlp
 """
 import sys
+import types
+
+# Shared, read-only extractor arguments. Modern browser-based extraction
+# (fixes PhantomJS warnings) needs no specific player client, so the value
+# never changes and can be reused by every generated options dict.
+_EXTRACTOR_ARGS = types.MappingProxyType({'youtube': types.MappingProxyType({})})
+
+def _build_format_string(resolution, use_https, use_m4a):
+    """Build the yt-dlp format selector for a resolution (None for audio only)."""
+    https = "[protocol=https]" if use_https else ""
+    
+    if not resolution:
+        # Audio only format
+        if use_m4a:
+            return f"bestaudio{https}[ext=m4a]"
+        return f"bestaudio{https}/best"
+    
+    # Video format - exclude AV1 codec for iOS compatibility
+    video_ext = "[ext=mp4]" if use_m4a else ""
+    audio_ext = "[ext=m4a]" if use_m4a else ""
+    video = f"bestvideo[height<={resolution}][vcodec!*=av01]{https}{video_ext}"
+    audio = f"bestaudio{https}{audio_ext}"
+    
+    # Fall back options - also exclude AV1 in fallback
+    fallback = f"best[height<={resolution}][vcodec!*=av01]{https}{video_ext}"
+    return f"{video}+{audio}/{fallback}/best"
+
+# Format selectors for every combination the UI offers, built once at import
+_FORMAT_TABLE = {
+    (resolution, use_https, use_m4a): _build_format_string(resolution, use_https, use_m4a)
+    for resolution in (None, 1080, 720, 480)
+    for use_https in (True, False)
+    for use_m4a in (True, False)
+}
+
+def _format_string(resolution, use_https, use_m4a):
+    """Look up the format selector, building it for resolutions outside the table."""
+    key = (resolution or None, bool(use_https), bool(use_m4a))
+    format_str = _FORMAT_TABLE.get(key)
+    if format_str is None:
+        format_str = _build_format_string(*key)
+    return format_str
 
 class YtDlpModel:
     """
@@ -10,6 +52,23 @@ class YtDlpModel:
     for the yt-dlp command line tool.
     """
 
+    @staticmethod
+    def cookie_file_path():
+        """Return the path of the exported YouTube cookie file in the Docs directory."""
+        import os
+        
+        # Get the base directory of the application
+        if getattr(sys, 'frozen', False):
+            # Running as compiled executable
+            base_dir = os.path.dirname(sys.executable)
+        else:
+            # Running from script
+            import pathlib
+            base_dir = pathlib.Path(__file__).parent.parent.parent.parent.absolute()
+            
+        # Path to the cookie file
+        return os.path.join(base_dir, 'Docs', 'yt_cookies.txt')
+
     @staticmethod
     def generate_format_string(resolution=None, use_https=True, use_m4a=True, subtitle_lang=None, use_cookies=False):
         """
@@ -19,7 +78,7 @@ class YtDlpModel:
             resolution (int, optional): Video resolution (1080, 720, 480, None for audio only)
             use_https (bool): Whether to prefer HTTPS protocol
             use_m4a (bool): Whether to prefer M4A/MP4 formats
-            subtitle_lang (str, optional): Language code for subtitles (e.g., 'en', 'es', etc.) or None to disable
+            subtitle_lang (str, optional): Language code for subtitles (e.g., 'en', 'es', etc.), a list/tuple of codes, or None to disable
             use_cookies (bool): Whether to use Firefox cookies to bypass YouTube bot verification
             
         Returns:
@@ -28,11 +87,7 @@ class YtDlpModel:
         format_options = {}
         
         # Add modern browser-based extraction method to fix PhantomJS warnings
-        format_options['extractor_args'] = {
-            'youtube': {
-                # No specific player client requirement
-            }
-        }
+        format_options['extractor_args'] = _EXTRACTOR_ARGS
         
         print(f"DEBUG: YtDlpModel.generate_format_string called with: resolution={resolution}, use_https={use_https}, use_m4a={use_m4a}, subtitle_lang={subtitle_lang}, use_cookies={use_cookies}")
         
@@ -41,17 +96,7 @@ class YtDlpModel:
             import os
             
             # Use the existing cookie file in the Docs directory
-            # Get the base directory of the application
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                base_dir = os.path.dirname(sys.executable)
-            else:
-                # Running from script
-                import pathlib
-                base_dir = pathlib.Path(__file__).parent.parent.parent.parent.absolute()
-                
-            # Path to the cookie file
-            cookie_file = os.path.join(base_dir, 'Docs', 'yt_cookies.txt')
+            cookie_file = YtDlpModel.cookie_file_path()
             
             if os.path.exists(cookie_file):
                 format_options['cookies'] = cookie_file
@@ -68,9 +113,9 @@ class YtDlpModel:
             format_options['writeautomaticsub'] = True  # Include auto-generated subtitles
             
             # Set the language(s) to download
-            if isinstance(subtitle_lang, list):
-                # If subtitle_lang is a list (e.g., ['zh-CN', 'zh-TW'] for Chinese)
-                format_options['subtitleslangs'] = subtitle_lang
+            if isinstance(subtitle_lang, (list, tuple)):
+                # If subtitle_lang is a list or tuple (e.g., ('zh-CN', 'zh-TW') for Chinese)
+                format_options['subtitleslangs'] = list(subtitle_lang)
                 print(f"DEBUG: Multiple subtitle languages requested: {subtitle_lang}")
             elif subtitle_lang.lower() == 'all':
                 format_options['subtitleslangs'] = ['all']
@@ -86,29 +131,7 @@ class YtDlpModel:
         
         if resolution:
             print(f"DEBUG: Generating video format with resolution: {resolution}")
-            # Video format - exclude AV1 codec for iOS compatibility
-            format_str = f"bestvideo[height<={resolution}][vcodec!*=av01]"
-            if use_https:
-                format_str += "[protocol=https]"
-            if use_m4a:
-                format_str += "[ext=mp4]"
-            
-            # Audio format
-            audio_str = "bestaudio"
-            if use_https:
-                audio_str += "[protocol=https]"
-            if use_m4a:
-                audio_str += "[ext=m4a]"
-            
-            # Fall back options - also exclude AV1 in fallback
-            fallback = f"best[height<={resolution}][vcodec!*=av01]"
-            if use_https:
-                fallback += "[protocol=https]"
-            if use_m4a and resolution:
-                fallback += "[ext=mp4]"
-            
-            # Complete format string
-            format_str = f"{format_str}+{audio_str}/{fallback}/best"
+            format_str = _format_string(resolution, use_https, use_m4a)
             format_options["format"] = format_str
             
             # Force MP4 output if m4a is selected
@@ -125,15 +148,9 @@ class YtDlpModel:
             
         else:
             print(f"DEBUG: Generating audio-only format")
-            # Audio only format
-            format_str = "bestaudio"
-            if use_https:
-                format_str += "[protocol=https]"
+            format_str = _format_string(None, use_https, use_m4a)
             if use_m4a:
-                format_str += "[ext=m4a]"
                 format_options["merge_output_format"] = "m4a"
-            else:
-                format_str += "/best"
             
             format_options["format"] = format_str
                 
@@ -5,6 +5,16 @@ import os
 import re
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# ANSI color codes follow the pattern: ESC[ ... m
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+def strip_ansi(text):
+    """Remove ANSI color codes from text."""
+    # Most yt-dlp output has no escape codes at all, so skip the regex
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
+
 class DownloadService(QObject):
     """Service for handling YouTube download operations."""
     
@@ -62,7 +72,7 @@ class DownloadService(QObject):
     
     def clean_ansi_codes(self, text):
         """Remove ANSI color codes from text."""
-        return re.sub(r'\x1b\[[0-9;]*m', '', text)
+        return strip_ansi(text)
     
     def create_download_options(self, format_options, output_dir):
         """Create download options for yt-dlp."""
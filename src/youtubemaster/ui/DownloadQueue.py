@@ -5,18 +5,39 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QLabel, 
     QSizePolicy, QHBoxLayout, QSpinBox, QPushButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QObject, QRunnable, QThreadPool
 import os
+from functools import partial
 
 from youtubemaster.ui.FlowLayout import FlowLayout
 from youtubemaster.models.DownloadManager import DownloadManager
 from youtubemaster.ui.YoutubeProgress import YoutubeProgress
+from youtubemaster.utils.logger import Logger
+
+class _ExistsCheck(QRunnable):
+    """Checks on a pool thread whether a downloaded file exists."""
+    
+    class Signals(QObject):
+        finished = pyqtSignal(str, bool)  # filepath, exists
+    
+    def __init__(self, filepath):
+        """Initialize the check for the given path."""
+        super().__init__()
+        self.filepath = filepath
+        self.signals = _ExistsCheck.Signals()
+    
+    def run(self):
+        """Stat the file and report the result."""
+        self.signals.finished.emit(self.filepath, os.path.exists(self.filepath))
 
 class DownloadQueue(QScrollArea):
     """
     A component that displays a queue of YouTube downloads with thumbnails and progress.
     """
     
+    # Maximum number of removed progress components kept for reuse
+    POOL_SIZE = 16
+    
     def __init__(self, download_manager):
         """Initialize the download queue."""
         super().__init__()
@@ -24,6 +45,9 @@ class DownloadQueue(QScrollArea):
         # Store reference to download manager
         self.download_manager = download_manager
         
+        # Logger
+        self.logger = Logger()
+        
         # Configure the scroll area
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -66,6 +90,7 @@ class DownloadQueue(QScrollArea):
         # Use FlowLayout for the downloads grid
         self.flow_layout = FlowLayout()
         self.flow_layout.setSpacing(10)  # Add some space between items
+        self.flow_layout.setUniformItemSize(YoutubeProgress.FIXED_SIZE)  # All tiles are the same size
         
         # Main layout to contain header and flow layout
         main_layout = QVBoxLayout(self.container)
@@ -86,41 +111,64 @@ class DownloadQueue(QScrollArea):
         # Create a dictionary to track progress components
         self.progress_components = {}
         
+        # Last (status, progress, title, thumbnail key) applied to each component
+        self._applied_state = {}
+        
+        # Removed components kept for reuse by later additions
+        self._pool = []
+        
+        # Progress updates buffered per URL and painted at most every 60 ms
+        self._pending_progress = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(60)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        
         # Initial queue update
         self.update_queue()
     
-    def _create_cancel_handler(self, url):
-        """Create a function that captures the URL parameter correctly."""
-        return lambda: self.on_cancel_clicked(url)
-    
-    def _create_dismiss_handler(self, url):
-        """Create a function that captures the URL parameter correctly for dismiss action."""
-        return lambda: self.on_dismiss_clicked(url)
-    
     def update_queue(self):
         """Update the display of the download queue."""
-        # Clear existing progress components that are no longer in the queue
-        urls_in_queue = set(self.download_manager.get_all_urls())
-        urls_to_remove = set(self.progress_components.keys()) - urls_in_queue
+        states = self.download_manager.snapshot_all()
         
-        for url in urls_to_remove:
-            if url in self.progress_components:
-                component = self.progress_components.pop(url)
-                # Remove from layout and delete
-                self.flow_layout.removeWidget(component)
+        # Clear existing progress components that are no longer in the queue
+        for url in [url for url in self.progress_components if url not in states]:
+            component = self.progress_components.pop(url)
+            self._applied_state.pop(url, None)
+            # Detach; unparenting makes Qt take the item out of the
+            # flow layout (via takeAt) before any further layout pass
+            component.hide()
+            component.setParent(None)
+            
+            # Park it for reuse unless the pool is full (reset() clears any error styling)
+            if len(self._pool) < self.POOL_SIZE:
+                self._pool.append(component)
+            else:
                 component.deleteLater()
         
-        # Add new items to the queue
-        for url in urls_in_queue:
+        # Add new items to the queue, in the manager's order
+        for url, state in states.items():
+            # Get download status and metadata
+            status, progress, title, thumbnail = state[:4]
+            
+            # Skip rows whose manager state hasn't changed since the last refresh
+            state = (status, progress, title, thumbnail.cacheKey() if thumbnail else None)
+            if self._applied_state.get(url) == state:
+                continue
+            self._applied_state[url] = state
+            
             if url not in self.progress_components:
-                # Get download status and metadata
-                status = self.download_manager.get_status(url)
-                progress = self.download_manager.get_progress(url)
-                title = self.download_manager.get_title(url) or "Loading..."
-                thumbnail = self.download_manager.get_thumbnail(url)
+                title = title or "Loading..."
+                
+                # Reuse a parked progress component if there is one
+                if self._pool:
+                    progress_component = self._pool.pop()
+                    progress_component.reset(url, title)
+                else:
+                    progress_component = YoutubeProgress(url, title)
                 
-                # Create progress component
-                progress_component = YoutubeProgress(url, title)
+                # Hold off repaints until the component is in the layout
+                progress_component.setUpdatesEnabled(False)
                 
                 # Set up component with initial data
                 # Order matters: thumbnail first, then status, progress, and title last
@@ -135,30 +183,29 @@ class DownloadQueue(QScrollArea):
                 
                 # Connect the cancel signal with explicit URL capture
                 progress_component.cancel_requested.connect(
-                    self._create_cancel_handler(url)
+                    partial(self.on_cancel_clicked, url)
                 )
                 
                 # Connect the dismiss signal with explicit URL capture
                 progress_component.dismiss_requested.connect(
-                    self._create_dismiss_handler(url)
+                    partial(self.on_dismiss_clicked, url)
                 )
                 
                 # Add to layout and dictionary
                 self.flow_layout.addWidget(progress_component)
                 self.progress_components[url] = progress_component
+                
+                # Re-enabling updates schedules a single repaint; pooled
+                # components were hidden explicitly, so show them again
+                progress_component.setUpdatesEnabled(True)
+                progress_component.show()
             else:
                 # Update existing component with latest data
                 component = self.progress_components[url]
                 
-                # Get latest metadata
-                title = self.download_manager.get_title(url)
-                thumbnail = self.download_manager.get_thumbnail(url)
-                status = self.download_manager.get_status(url)
-                progress = self.download_manager.get_progress(url)
-                
                 # Update component with latest data
                 # Order matters: thumbnail first, then status, progress, and title last
-                if thumbnail and not component.thumbnail.pixmap():
+                if thumbnail:
                     component.set_thumbnail(thumbnail)
                 
                 if status:
@@ -176,19 +223,19 @@ class DownloadQueue(QScrollArea):
             component = self.progress_components[url]
             
             # Get current title before any updates
-            current_title = component.progress_bar.title_label.text()
+            current_title = component.progress_bar.title
             
             # First apply the thumbnail if available
             if thumbnail and not thumbnail.isNull():
                 component.set_thumbnail(thumbnail)
             
+            state = self.download_manager.snapshot(url)
+            
             # Set status (this will update the status overlay)
-            status = self.download_manager.get_status(url) or "Starting"
-            component.set_status(status)
+            component.set_status(state.status or "Starting")
             
             # Set progress
-            progress = self.download_manager.get_progress(url) or 0
-            component.set_progress(progress)
+            component.set_progress(state.progress or 0)
             
             # Skip complex logic and directly set the title when we have a real title
             if title and not (title.startswith("Loading") or title == "Downloading..."):
@@ -204,16 +251,27 @@ class DownloadQueue(QScrollArea):
     
     def on_download_progress(self, url, progress, status_text):
         """Handle download progress signal."""
-        if url in self.progress_components:
-            component = self.progress_components[url]
-            component.set_progress(progress)
-            if status_text:
-                component.set_stats(status_text)
+        # Only keep the latest value per URL until the next flush
+        self._pending_progress[url] = (progress, status_text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the buffered progress updates to their components."""
+        pending, self._pending_progress = self._pending_progress, {}
+        for url, (progress, status_text) in pending.items():
+            component = self.progress_components.get(url)
+            if component:
+                component.set_progress(progress)
+                if status_text:
+                    component.set_stats(status_text)
     
     def on_download_complete(self, url, output_dir=None, filename=None):
         """Handle download completion signal."""
-        # Important transition message
-        print(f"Download complete - URL: {url}")
+        self.logger.info("Download complete - URL: %s", url)
+        
+        # Drop any buffered progress so it can't overwrite the final state
+        self._pending_progress.pop(url, None)
         
         if url in self.progress_components:
             component = self.progress_components[url]
@@ -224,20 +282,27 @@ class DownloadQueue(QScrollArea):
             # Set the output path and filename for file explorer access
             if output_dir:
                 component.set_output_path(output_dir, filename)
-                # Verify the file exists - keep this as a warning message
+                # Verify the file exists, without stat-ing on the UI thread
                 if filename:
-                    filepath = os.path.join(output_dir, filename)
-                    if not os.path.exists(filepath):
-                        print(f"WARNING: File does not exist at expected path: {filepath}")
+                    check = _ExistsCheck(os.path.join(output_dir, filename))
+                    check.signals.finished.connect(self._on_exists_checked)
+                    QThreadPool.globalInstance().start(check)
             else:
-                print(f"WARNING: No output directory provided for {url}")
+                self.logger.warning("No output directory provided for %s", url)
         else:
-            print(f"WARNING: No component found for URL: {url}")
+            self.logger.warning("No component found for URL: %s", url)
+    
+    def _on_exists_checked(self, filepath, exists):
+        """Warn when a completed download's file isn't where it was reported."""
+        if not exists:
+            self.logger.warning("File does not exist at expected path: %s", filepath)
     
     def on_download_error(self, url, error_message):
         """Handle download error signal."""
-        # Keep error messages
-        print(f"Error for URL: {url} - {error_message}")
+        self.logger.error("Error for URL: %s - %s", url, error_message)
+        
+        # Drop any buffered progress so it can't overwrite the error state
+        self._pending_progress.pop(url, None)
         
         if url in self.progress_components:
             component = self.progress_components[url]
@@ -256,9 +321,6 @@ class DownloadQueue(QScrollArea):
             
             # Apply a visual indicator for error state
             component.highlight_error()
-        
-        # Force an update of the UI
-        self.update_queue()
     
     def on_cancel_clicked(self, url):
         """Handle cancel button click with explicit URL parameter."""
@@ -267,9 +329,9 @@ class DownloadQueue(QScrollArea):
             if url and isinstance(url, str):
                 self.download_manager.cancel_download(url)
             else:
-                print(f"Error: Invalid URL for cancellation: {url}")
+                self.logger.error("Invalid URL for cancellation: %s", url)
         except Exception as e:
-            print(f"Error cancelling download: {e}")
+            self.logger.error("Error cancelling download: %s", e)
     
     def on_dismiss_clicked(self, url):
         """Handle dismiss button click for error items."""
@@ -278,9 +340,9 @@ class DownloadQueue(QScrollArea):
             if url and isinstance(url, str):
                 self.download_manager.dismiss_error(url)
             else:
-                print(f"Error: Invalid URL for dismiss: {url}")
+                self.logger.error("Invalid URL for dismiss: %s", url)
         except Exception as e:
-            print(f"Error dismissing download: {e}")
+            self.logger.error("Error dismissing download: %s", e)
     
     def clear_completed_downloads(self):
         """Clear all completed downloads from the queue."""
@@ -291,6 +353,9 @@ class DownloadQueue(QScrollArea):
             if component.status == "Complete":
                 urls_to_remove.append(url)
         
-        # Cancel each download (which removes it from the UI)
-        for url in urls_to_remove:
-            self.download_manager.cancel_download(url) 
\ No newline at end of file
+        # Remove them in one batch so the queue is refreshed and repainted once
+        self.container.setUpdatesEnabled(False)
+        try:
+            self.download_manager.cancel_downloads(urls_to_remove)
+        finally:
+            self.container.setUpdatesEnabled(True) 
\ No newline at end of file
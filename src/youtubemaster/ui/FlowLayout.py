@@ -3,7 +3,9 @@ A FlowLayout implementation for PyQt6.
 Similar to Qt Designer's Flow Layout example but adapted for PyQt6.
 """
 
-from PyQt6.QtCore import Qt, QSize, QRect, QPoint
+from array import array
+
+from PyQt6.QtCore import Qt, QSize, QRect
 from PyQt6.QtWidgets import QLayout, QLayoutItem, QWidgetItem, QStyle
 
 
@@ -14,6 +16,25 @@ class FlowLayout(QLayout):
         """Initialize the flow layout."""
         super().__init__(parent)
         
+        # Size hint widths/heights stored as int arrays parallel to self.items, plus
+        # the largest minimum size; rebuilt lazily after add/take/invalidate().
+        # Created first because setSpacing() below already invalidates the layout.
+        self._sh_w = array('i')
+        self._sh_h = array('i')
+        self._minSize = QSize()
+        self._sizesValid = False
+        
+        # Layout item per widget, keyed by id(widget), so removeWidget needn't scan
+        self._widget_to_item = {}
+        
+        # Row packing from the last pass, keyed by (width, items version), so the
+        # setGeometry() that follows heightForWidth() only has to apply it
+        self._layoutCache = None
+        self._itemsVersion = 0
+        
+        # Size shared by every item, if set; lets packing skip per-item size hints
+        self._uniform = None
+        
         if parent is not None:
             self.setContentsMargins(margin, margin, margin, margin)
         
@@ -21,15 +42,13 @@ class FlowLayout(QLayout):
         
         self.items = []
     
-    def __del__(self):
-        """Delete all items in the layout."""
-        item = self.takeAt(0)
-        while item:
-            item = self.takeAt(0)
-    
     def addItem(self, item):
         """Add an item to the layout."""
         self.items.append(item)
+        self._itemsVersion += 1
+        if item.widget() is not None:
+            self._widget_to_item[id(item.widget())] = item
+        self._sizesValid = False
     
     def count(self):
         """Return the number of items in the layout."""
@@ -44,9 +63,45 @@ class FlowLayout(QLayout):
     def takeAt(self, index):
         """Remove and return the item at the given index."""
         if 0 <= index < len(self.items):
-            return self.items.pop(index)
+            item = self.items.pop(index)
+            self._itemsVersion += 1
+            self._sizesValid = False
+            if item.widget() is not None:
+                self._widget_to_item.pop(id(item.widget()), None)
+            return item
         return None
     
+    def invalidate(self):
+        """Drop cached item sizes and invalidate the layout."""
+        self._sizesValid = False
+        self._itemsVersion += 1
+        super().invalidate()
+    
+    def _ensureSizes(self):
+        """Rebuild the size hint arrays if items changed since the last build."""
+        if self._sizesValid:
+            return
+        
+        widths = array('i')
+        heights = array('i')
+        minSize = QSize()
+        for item in self.items:
+            # Use the widget's own sizeHint if it has one, otherwise the item's
+            sizeHint = (item.widget() or item).sizeHint()
+            widths.append(sizeHint.width())
+            heights.append(sizeHint.height())
+            minSize = minSize.expandedTo(item.minimumSize())
+        
+        self._sh_w = widths
+        self._sh_h = heights
+        self._minSize = minSize
+        self._sizesValid = True
+    
+    def setUniformItemSize(self, size):
+        """Declare that every item has the given fixed size (None to disable)."""
+        self._uniform = QSize(size) if size is not None else None
+        self.invalidate()
+    
     def expandingDirections(self):
         """Return the expanding directions of the layout."""
         return Qt.Orientation(0)
@@ -72,8 +127,12 @@ class FlowLayout(QLayout):
         """Return the minimum size of the layout."""
         size = QSize()
         
-        for item in self.items:
-            size = size.expandedTo(item.minimumSize())
+        if self._uniform is not None:
+            if self.items:
+                size = QSize(self._uniform)
+        else:
+            self._ensureSizes()
+            size = QSize(self._minSize)
         
         margin = self.contentsMargins()
         size += QSize(margin.left() + margin.right(), margin.top() + margin.bottom())
@@ -90,55 +149,111 @@ class FlowLayout(QLayout):
         Returns:
             The required height for the layout
         """
-        x = rect.x()
-        y = rect.y()
+        key = (rect.x(), rect.width(), self._itemsVersion)
+        if self._layoutCache is None or self._layoutCache[0] != key:
+            self._layoutCache = (key,) + self._packItems(rect.x(), rect.width())
+        placements, totalHeight = self._layoutCache[1:]
+        
+        # Set the item geometries (if not just testing), offset by the rect origin
+        if not testOnly:
+            left = rect.x()
+            top = rect.y()
+            for item, x, y, w, h in placements:
+                item.setGeometry(QRect(left + x, top + y, w, h))
+        
+        return totalHeight
+    
+    def _packItems(self, originX, width):
+        """Pack the items into rows for the given width.
+        
+        The wrap check compares the absolute x position (including originX)
+        against the width minus margins, exactly as the original layout did.
+        
+        Returns:
+            A (placements, totalHeight) tuple, where placements holds an
+            (item, x, y, width, height) entry per item relative to the layout origin
+        """
+        if self._uniform is not None:
+            return self._packUniformItems(originX, width)
+        
         lineHeight = 0
         spacing = self.spacing()
         margin = self.contentsMargins()
+        placements = []
+        
+        # Hoist margins and bound methods out of the per-item loop
+        left = margin.left()
+        append = placements.append
+        self._ensureSizes()
         
         # Adjust for margins
-        x += margin.left()
-        y += margin.top()
+        x = left
+        y = margin.top()
         
         # Calculate effective width (width minus margins)
-        effectiveWidth = rect.width() - margin.left() - margin.right()
+        effectiveWidth = width - left - margin.right()
         
-        for item in self.items:
-            wid = item.widget()
-            
-            # Get item size (use sizeHint if it's a widget, otherwise minimumSize)
-            if wid:
-                nextWidth = wid.sizeHint().width()
-                nextHeight = wid.sizeHint().height()
-            else:
-                nextWidth = item.sizeHint().width()
-                nextHeight = item.sizeHint().height()
+        # Item sizes come from the parallel arrays (queried once per item until invalidated)
+        for item, nextWidth, nextHeight in zip(self.items, self._sh_w, self._sh_h):
             
             # If adding this item would exceed the width, move to the next row
-            if x + nextWidth > effectiveWidth and lineHeight > 0:
-                x = rect.x() + margin.left()
-                y = y + lineHeight + spacing
+            if originX + x + nextWidth > effectiveWidth and lineHeight > 0:
+                x = left
+                y += lineHeight + spacing
                 lineHeight = 0
             
-            # Set the item's geometry (if not just testing)
-            if not testOnly:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+            append((item, x, y, nextWidth, nextHeight))
             
             # Update position and line height
-            x = x + nextWidth + spacing
-            lineHeight = max(lineHeight, nextHeight)
+            x += nextWidth + spacing
+            if nextHeight > lineHeight:
+                lineHeight = nextHeight
         
         # Calculate total height including the last row
-        totalHeight = y + lineHeight - rect.y() + margin.bottom()
+        totalHeight = y + lineHeight + margin.bottom()
         
-        return totalHeight
+        return placements, totalHeight
+    
+    def _packUniformItems(self, originX, width):
+        """Pack same-sized items into a grid using integer math only."""
+        w = self._uniform.width()
+        h = self._uniform.height()
+        spacing = self.spacing()
+        margin = self.contentsMargins()
+        left = margin.left()
+        top = margin.top()
+        stepX = w + spacing
+        stepY = h + spacing
+        
+        # Same wrap rule as _packItems: column c fits while
+        # originX + left + c * stepX + w <= width - left - right (at least one)
+        effectiveWidth = width - left - margin.right()
+        cols = max(1, (effectiveWidth - originX - left + spacing) // stepX)
+        
+        placements = []
+        for index, item in enumerate(self.items):
+            row, col = divmod(index, cols)
+            placements.append((item, left + col * stepX, top + row * stepY, w, h))
+        
+        # Calculate total height including the last row
+        rows = -(-len(self.items) // cols)
+        totalHeight = margin.top() + margin.bottom()
+        if rows:
+            totalHeight += rows * stepY - spacing
+        
+        return placements, totalHeight
+    
+    def clear(self):
+        """Remove every item from the layout, leaving widget ownership to Qt."""
+        while self.takeAt(0) is not None:
+            pass
     
     def removeWidget(self, widget):
         """Remove a widget from the layout."""
-        for i in range(len(self.items) - 1, -1, -1):
-            item = self.items[i]
-            if item.widget() == widget:
-                self.takeAt(i)
-                widget.setParent(None)
-                self.update()
-                return 
\ No newline at end of file
+        item = self._widget_to_item.pop(id(widget), None)
+        if item is not None:
+            self.items.remove(item)
+            self._itemsVersion += 1
+            self._sizesValid = False
+            widget.setParent(None)
+            self.update()
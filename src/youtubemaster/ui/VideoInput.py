@@ -1,35 +1,63 @@
 """
 Video Input component for YouTube Master application.
 """
+import logging
 import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
-    QPushButton, QButtonGroup, QLabel, QComboBox
+    QPushButton, QButtonGroup, QLabel, QComboBox, QAbstractButton
 )
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
+from functools import lru_cache
 
-from youtubemaster.models.YoutubeModel import YoutubeModel
 from youtubemaster.models.Yt_DlpModel import YtDlpModel
-from youtubemaster.models.ThemeManager import ThemeManager
 from youtubemaster.models.SiteModel import SiteModel
 from youtubemaster.utils.config import config
+from youtubemaster.utils.logger import Logger
+
+# Set to True to log format selection details (skips building the messages otherwise)
+_DEBUG = False
+
+# Subtitle variants requested when Chinese is selected: simplified, traditional, Hong Kong
+_ZH_VARIANTS = ('zh-CN', 'zh-TW', 'zh-HK')
+
+@lru_cache(maxsize=32)
+def _format_options(resolution, use_https, use_m4a, subtitle_lang, use_cookies, cookie_file_exists):
+    """Generate yt-dlp options for one button state, shared by all VideoInputs."""
+    # cookie_file_exists is only part of the cache key: the generated options
+    # depend on whether the cookie file is there, which can change at runtime
+    if _DEBUG:
+        Logger().debug(
+            "Generating format options with resolution=%s, https=%s, m4a=%s, subtitle_lang=%s, cookies=%s",
+            resolution, use_https, use_m4a, subtitle_lang, use_cookies,
+        )
+    
+    return YtDlpModel.generate_format_string(
+        resolution=resolution,
+        use_https=use_https,
+        use_m4a=use_m4a,
+        subtitle_lang=subtitle_lang,
+        use_cookies=use_cookies
+    )
 
 class ToggleButton(QPushButton):
     """Custom toggle button that can be toggled on/off with clear visual state."""
     
+    # Sizing shared by every toggle button
+    MIN_WIDTH = 50  # Reduced from 70 to 50
+    HEIGHT = 22  # Fixed height to make buttons shorter
+    
     def __init__(self, text, parent=None, exclusive=False):
         """Initialize the toggle button."""
         super().__init__(text, parent)
         self.setCheckable(True)
         self._exclusive = exclusive
-        self.setMinimumWidth(50)  # Reduced from 70 to 50
+        self.setMinimumWidth(self.MIN_WIDTH)
         
-        # Apply stylesheet for toggle states with smaller dimensions
-        self.setStyleSheet(ThemeManager.get_toggle_button_style())
+        # The toggle-state stylesheet lives on the application, not per button
         
         # Set a fixed height to make buttons shorter
-        self.setFixedHeight(22)  # This will make them shorter
+        self.setFixedHeight(self.HEIGHT)
     
     def toggle(self):
         """Toggle the button state."""
@@ -56,6 +84,9 @@ class VideoInput(QWidget):
         """Initialize the video input component."""
         super().__init__(parent)
         
+        # Logger
+        self.logger = Logger()
+        
         # Initialize layout
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -80,6 +111,18 @@ class VideoInput(QWidget):
         
         self.layout.addLayout(url_row)
         
+        # Collapse bursts of update_format() calls into one emit per event-loop turn
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_emit_format)
+        
+        # Settings changed by the toggles are written to disk in one batch
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(500)
+        self._config_flush_timer.timeout.connect(config.flush)
+        
         # Create format selection row
         self.create_format_row()
         
@@ -93,26 +136,24 @@ class VideoInput(QWidget):
         
         # Create resolution buttons
         self.resolution_group = QButtonGroup(self)
-        self.resolution_group.setExclusive(False)  # We'll handle exclusivity manually
+        self.resolution_group.setExclusive(True)  # Qt keeps exactly one checked
         
         self.btn_1080p = ToggleButton("1080p", exclusive=True)
         self.btn_720p = ToggleButton("720p", exclusive=True)
         self.btn_480p = ToggleButton("480p", exclusive=True)
         self.btn_audio = ToggleButton("Audio", exclusive=True)
         
+        # Plain tuple of the resolution buttons, so iterating them doesn't go through Qt
+        self._res_buttons = (self.btn_1080p, self.btn_720p, self.btn_480p, self.btn_audio)
+        
         # Set 720p as default
         self.btn_720p.setChecked(True)
+        self._resolution_button = self.btn_720p
         
         # Add buttons to layout and group
-        format_layout.addWidget(self.btn_1080p)
-        format_layout.addWidget(self.btn_720p)
-        format_layout.addWidget(self.btn_480p)
-        format_layout.addWidget(self.btn_audio)
-        
-        self.resolution_group.addButton(self.btn_1080p)
-        self.resolution_group.addButton(self.btn_720p)
-        self.resolution_group.addButton(self.btn_480p)
-        self.resolution_group.addButton(self.btn_audio)
+        for button in self._res_buttons:
+            format_layout.addWidget(button)
+            self.resolution_group.addButton(button)
         
         # Create option toggles
         self.btn_https = ToggleButton("HTTPS")
@@ -122,6 +163,12 @@ class VideoInput(QWidget):
         self.btn_m4a = ToggleButton("M4A")
         self.btn_m4a.setChecked(True)  # Default is on
         format_layout.addWidget(self.btn_m4a)
+        
+        # Non-exclusive group so both option toggles share one clicked connection
+        self.options_group = QButtonGroup(self)
+        self.options_group.setExclusive(False)
+        self.options_group.addButton(self.btn_https)
+        self.options_group.addButton(self.btn_m4a)
 
         # Create subtitle toggle button (not added to layout yet - will be added after other toggles)
         self.btn_subtitles = ToggleButton("Subtitles")
@@ -179,12 +226,12 @@ class VideoInput(QWidget):
         # Set current value from config
         current_lang = config.get('subtitles.language', 'en')
         index = self.subtitle_lang_combo.findData(current_lang)
-        if index >= 0:
-            self.subtitle_lang_combo.setCurrentIndex(index)
-        else:
-            # If not found in predefined list, add it as custom option
-            self.subtitle_lang_combo.addItem(current_lang, current_lang)
-            self.subtitle_lang_combo.setCurrentText(current_lang)
+        if index < 0:
+            # If not found in predefined list, add it as custom option and
+            # select it by index so get_format_options reads its code
+            self.subtitle_lang_combo.addItem(str(current_lang), current_lang)
+            index = self.subtitle_lang_combo.count() - 1
+        self.subtitle_lang_combo.setCurrentIndex(index)
         
         # Connect signal to save changes
         self.subtitle_lang_combo.currentTextChanged.connect(self.on_subtitle_lang_changed)
@@ -194,52 +241,63 @@ class VideoInput(QWidget):
         format_layout.addStretch()
         
         # Connect signals
-        self.btn_1080p.clicked.connect(self.on_resolution_clicked)
-        self.btn_720p.clicked.connect(self.on_resolution_clicked)
-        self.btn_480p.clicked.connect(self.on_resolution_clicked)
-        self.btn_audio.clicked.connect(self.on_resolution_clicked)
-        self.btn_https.clicked.connect(self.update_format)
-        self.btn_m4a.clicked.connect(self.update_format)
+        self.resolution_group.buttonClicked.connect(self.on_resolution_clicked)
+        self.options_group.buttonClicked.connect(self.on_option_clicked)
         
         self.layout.addLayout(format_layout)
     
-    def on_resolution_clicked(self):
+    @pyqtSlot(QAbstractButton)
+    def on_resolution_clicked(self, button):
         """Handle resolution button clicks - ensure one is always selected."""
-        sender = self.sender()
-        
-        # Ensure one resolution is always selected
-        if not sender.isChecked():
-            sender.setChecked(True)
+        # The exclusive group keeps the clicked button checked, so clicking
+        # the current selection again changes nothing
+        if button is self._resolution_button:
             return
-        
-        # Uncheck all other resolution buttons
-        for button in self.resolution_group.buttons():
-            if button != sender:
-                button.setChecked(False)
+        self._resolution_button = button
         
         # If audio is selected, turn off m4a (user can turn it back on)
-        if sender == self.btn_audio:
-            print("DEBUG: Audio button selected, turning off M4A by default")
+        if button is self.btn_audio:
+            if _DEBUG:
+                self.logger.debug("Audio button selected, turning off M4A by default")
             self.btn_m4a.setChecked(False)
         
-        # Debug log button states
-        print(f"DEBUG: Button states - 1080p: {self.btn_1080p.isChecked()}, 720p: {self.btn_720p.isChecked()}, 480p: {self.btn_480p.isChecked()}, Audio: {self.btn_audio.isChecked()}")
+        # Debug log button states; the level check skips the isChecked() calls
+        # when debug records would be dropped anyway
+        if _DEBUG and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Button states - 1080p: %s, 720p: %s, 480p: %s, Audio: %s",
+                self.btn_1080p.isChecked(), self.btn_720p.isChecked(),
+                self.btn_480p.isChecked(), self.btn_audio.isChecked(),
+            )
         
         self.update_format()
     
-    def update_format(self):
-        """Update the format selection based on button states and emit signal."""
+    @pyqtSlot(QAbstractButton)
+    def on_option_clicked(self, _button):
+        """Handle HTTPS/M4A toggle clicks."""
+        self.update_format()
+    
+    @pyqtSlot(bool)
+    def update_format(self, _checked=False):
+        """Schedule a format_changed emit for the current button states."""
+        self._update_timer.start()
+    
+    @pyqtSlot()
+    def _do_emit_format(self):
+        """Emit format_changed with the current format options."""
         # Get format options from YtDlpModel
         format_dict = self.get_format_options()
         
         # Emit the format changed signal
         self.format_changed.emit(format_dict)
     
+    @pyqtSlot()
     def on_enter_pressed(self):
         """Handle enter key in URL field."""
         self.enter_pressed.emit()
     
-    def on_add_clicked(self):
+    @pyqtSlot(bool)
+    def on_add_clicked(self, _checked=False):
         """Handle Add button click."""
         self.add_clicked.emit()
     
@@ -268,7 +326,8 @@ class VideoInput(QWidget):
         elif self.btn_audio.isChecked():
             resolution = None  # Audio only
         else:
-            print("DEBUG: No resolution button is checked, defaulting to audio only")
+            if _DEBUG:
+                self.logger.debug("No resolution button is checked, defaulting to audio only")
             resolution = None
         
         # Get subtitles setting
@@ -290,58 +349,60 @@ class VideoInput(QWidget):
                 
                 # Special handling for Chinese to include simplified, traditional, and Hong Kong variants
                 if subtitle_lang == 'zh':
-                    subtitle_lang = ['zh-CN', 'zh-TW', 'zh-HK']
-                    print(f"DEBUG: Selected Chinese subtitles, downloading variants: {subtitle_lang}")
+                    subtitle_lang = _ZH_VARIANTS
+                    if _DEBUG:
+                        self.logger.debug("Selected Chinese subtitles, downloading variants: %s", subtitle_lang)
             else:
                 # Fallback to text if it's a custom entry
                 subtitle_lang = self.subtitle_lang_combo.currentText().strip()
         
-        # Log the options being used
-        print(f"DEBUG: Generating format options with resolution={resolution}, https={self.btn_https.isChecked()}, m4a={self.btn_m4a.isChecked()}, subtitle_lang={subtitle_lang}, cookies={cookies_enabled}, use_cli={use_cli}")
+        use_https = self.btn_https.isChecked()
+        use_m4a = self.btn_m4a.isChecked()
         
-        # Use YtDlpModel to generate the format options
-        options = YtDlpModel.generate_format_string(
-            resolution=resolution,
-            use_https=self.btn_https.isChecked(),
-            use_m4a=self.btn_m4a.isChecked(),
-            subtitle_lang=subtitle_lang,
-            use_cookies=cookies_enabled
-        )
+        # Identical selections reuse the cached options
+        cookie_file_exists = cookies_enabled and os.path.exists(YtDlpModel.cookie_file_path())
+        options = _format_options(resolution, use_https, use_m4a, subtitle_lang, cookies_enabled, cookie_file_exists)
         
-        # Add CLI option to the returned dictionary
+        # Copy so callers can't change the cached entry, then add the CLI option
+        options = dict(options)
         options['use_cli'] = use_cli
         
         # Log the generated format options
-        print(f"DEBUG: Generated format options: {options}")
+        if _DEBUG:
+            self.logger.debug("Generated format options: %s", options)
         
         return options
 
-    def set_format_audio_only(self):
-        """Set format selection to audio only"""
-        # Uncheck all resolution buttons
-        self.btn_1080p.setChecked(False)
-        self.btn_720p.setChecked(False)
-        self.btn_480p.setChecked(False)
-        
-        # Check audio button
-        self.btn_audio.setChecked(True)
+    def _select_resolution(self, button):
+        """Check a resolution button programmatically and emit one format update."""
+        # Keep the check-state changes from firing per-button signals
+        for b in self._res_buttons:
+            b.blockSignals(True)
+        try:
+            # The exclusive group unchecks the others
+            button.setChecked(True)
+        finally:
+            for b in self._res_buttons:
+                b.blockSignals(False)
+        self._resolution_button = button
         
         # Update format string
         self.update_format()
 
+    def set_format_audio_only(self):
+        """Set format selection to audio only"""
+        self._select_resolution(self.btn_audio)
+
     def set_format_video_720p(self):
         """Set format selection to 720p video"""
-        # Uncheck all other resolution buttons
-        self.btn_1080p.setChecked(False)
-        self.btn_480p.setChecked(False)
-        self.btn_audio.setChecked(False)
-        
-        # Check 720p button
-        self.btn_720p.setChecked(True)
-        
-        # Update format string
-        self.update_format()
+        self._select_resolution(self.btn_720p)
+
+    def _set_config(self, key, value):
+        """Change a setting in memory and schedule a batched save."""
+        config.set(key, value, save=False)
+        self._config_flush_timer.start()
 
+    @pyqtSlot(str)
     def on_subtitle_lang_changed(self, text):
         """Handle subtitle language changes and save to config."""
         # Get the language code from the data associated with the current selection
@@ -352,20 +413,23 @@ class VideoInput(QWidget):
             # For custom text entries, use the text as the code
             code = text.strip()
         
-        config.set('subtitles.language', code)
+        self._set_config('subtitles.language', code)
         self.update_format()
 
-    def on_subtitles_toggled(self):
+    @pyqtSlot(bool)
+    def on_subtitles_toggled(self, _checked=False):
         """Handle subtitles toggle and save to config."""
-        config.set('subtitles.enabled', self.btn_subtitles.isChecked())
+        self._set_config('subtitles.enabled', self.btn_subtitles.isChecked())
         self.update_format()
 
-    def on_cookies_toggled(self):
+    @pyqtSlot(bool)
+    def on_cookies_toggled(self, _checked=False):
         """Handle cookies toggle and save to config."""
-        config.set('cookies.enabled', self.btn_cookies.isChecked())
+        self._set_config('cookies.enabled', self.btn_cookies.isChecked())
         self.update_format()
 
-    def on_cli_toggled(self):
+    @pyqtSlot(bool)
+    def on_cli_toggled(self, _checked=False):
         """Handle CLI toggle and save to config."""
-        config.set('ytdlp.use_cli', self.btn_use_cli.isChecked())
+        self._set_config('ytdlp.use_cli', self.btn_use_cli.isChecked())
         self.update_format()
\ No newline at end of file
@@ -3,17 +3,78 @@ YouTube progress component for displaying download progress with thumbnails.
 """
 import os
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QProgressBar, QPushButton, QFrame, QSizePolicy
+    QWidget, QHBoxLayout, QLabel, 
+    QProgressBar, QPushButton, QFrame
+)
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import (
+    QPixmap, QPixmapCache, QFont, QFontMetrics, QColor, QPalette, QCursor,
+    QPainter, QBrush, QLinearGradient, QGradient
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap, QFont, QColor, QPalette, QCursor
 
 from youtubemaster.utils.config import config
 
+# Styles for every progress card, installed once on the application by
+# ThemeManager.apply_dark_theme instead of being parsed per widget
+STYLESHEET = """
+    TitleProgressBar {
+        border: 1px solid #555555;
+        background-color: #1E1E1E;
+    }
+    
+    TitleProgressBar QLabel {
+        background-color: transparent;
+        color: white;
+    }
+    
+    QPushButton#cancelBtn {
+        background-color: rgba(0, 0, 0, 0.7);
+        color: white;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 0px 0px 3px 0px; /* Adjust padding to center the × character */
+        text-align: center;
+    }
+    QPushButton#cancelBtn:hover {
+        background-color: rgba(255, 0, 0, 0.8);
+    }
+    
+    QPushButton#dismissBtn {
+        background-color: rgba(153, 0, 0, 0.8);
+        color: white;
+        border-radius: 3px;
+        font-weight: bold;
+        font-size: 8pt;
+        padding: 0px 5px;
+    }
+    QPushButton#dismissBtn:hover {
+        background-color: rgba(204, 0, 0, 0.9);
+    }
+    
+    QLabel#statsOverlay {
+        background-color: rgba(0, 0, 0, 0.7);
+        color: white;
+        padding: 3px;
+        border-radius: 2px;
+        font-size: 8pt;
+    }
+"""
+
 class TitleProgressBar(QFrame):
     """A custom progress bar that displays text and fills with a background color."""
     
+    # Title font, created with the first instance (QFont needs a running app)
+    _TITLE_FONT = None
+    
+    # Progress fill with reversed gradient (darker on left, brighter on right),
+    # stretched over whatever width is filled
+    _FILL_GRADIENT = QLinearGradient(0, 0, 1, 0)
+    _FILL_GRADIENT.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    _FILL_GRADIENT.setColorAt(0, QColor("#00213A"))  # Start with very dark blue
+    _FILL_GRADIENT.setColorAt(1, QColor("#007ACC"))  # End with bright blue
+    _FILL_BRUSH = QBrush(_FILL_GRADIENT)
+    
     def __init__(self, parent=None):
         """Initialize the title progress bar."""
         super().__init__(parent)
@@ -25,31 +86,23 @@ class TitleProgressBar(QFrame):
         self.setFrameShape(QFrame.Shape.Box)
         self.setFrameShadow(QFrame.Shadow.Plain)
         
-        # Create a child frame for the progress fill
-        self.progress_fill = QFrame(self)
-        self.progress_fill.setGeometry(1, 1, 0, self.height() - 2)  # Initial size with border offset
-        
-        # Set the progress fill with reversed gradient (darker on left, brighter on right)
-        self.progress_fill.setStyleSheet("""
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,  /* Direction: left to right */
-                stop:0 #00213A,  /* Start with very dark blue */
-                stop:1 #007ACC   /* End with bright blue */
-            );
-        """)
-        
         # Create layout for the text
         self.layout = QHBoxLayout(self)
         self.layout.setContentsMargins(5, 0, 5, 0)
         
         # Create label for title
-        self.title_label = QLabel("Loading...")
+        # Keep the displayed title on the Python side so readers don't have
+        # to query the QLabel for it
+        self.title = "Loading..."
+        self.title_label = QLabel(self.title)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         
-        # Use smaller font for title
-        font = self.title_label.font()
-        font.setPointSize(7)
-        self.title_label.setFont(font)
+        # Use smaller font for title, shared by every progress bar
+        if TitleProgressBar._TITLE_FONT is None:
+            font = QFont()
+            font.setPointSize(7)
+            TitleProgressBar._TITLE_FONT = font
+        self.title_label.setFont(TitleProgressBar._TITLE_FONT)
         
         # Add to layout
         self.layout.addWidget(self.title_label)
@@ -57,21 +110,9 @@ class TitleProgressBar(QFrame):
         # Ensure text appears on top of the progress fill
         self.title_label.raise_()
         
-        # Set the border and background
-        self.setStyleSheet("""
-            TitleProgressBar {
-                border: 1px solid #555555;
-                background-color: #1E1E1E;
-            }
-            
-            QLabel {
-                background-color: transparent;
-                color: white;
-            }
-        """)
-        
         # Initialize progress value
         self.progress_value = 0
+        self._last_fill_width = -1
     
     def set_title(self, title):
         """Set the title text."""
@@ -79,11 +120,11 @@ class TitleProgressBar(QFrame):
             return
         
         # Only update the title if we have a valid title or if current title is a loading placeholder
-        current_title = self.title_label.text()
+        current_title = self.title
         
         # If we have a real title (not a loading placeholder), always use it
         if title and not (title.startswith("Loading") or title == "Downloading..."):
-            self.title_label.setText(title)
+            self._show_title(title)
             return
         
         # Don't replace a real title with a generic Loading placeholder
@@ -94,31 +135,64 @@ class TitleProgressBar(QFrame):
         # If we have a placeholder and current title is also a placeholder, update it
         if (title.startswith("Loading") or title == "Downloading...") and (
                 not current_title or current_title.startswith("Loading") or current_title == "Downloading..."):
-            self.title_label.setText(title)
+            self._show_title(title)
             return
         
         # Fallback case - shouldn't normally reach here
-        self.title_label.setText(title)
+        self._show_title(title)
+    
+    def _show_title(self, title):
+        """Display the title and remember it."""
+        if title == self.title:
+            return
+        self.title = title
+        self._update_title_text()
+    
+    def _update_title_text(self):
+        """Show the title elided to the label's width, as Qt would render it."""
+        # Available width is the bar minus the 5px text margins on each side
+        elided = QFontMetrics(self._TITLE_FONT).elidedText(
+            self.title, Qt.TextElideMode.ElideRight, max(0, self.width() - 10))
+        if elided != self.title_label.text():
+            self.title_label.setText(elided)
     
     def set_progress(self, value):
         """Set the progress value (0-100)."""
         self.progress_value = max(0, min(100, value))
         
-        # Update the progress fill position and size
         # Fill from left to right instead of right to left
         fill_width = int((self.width() - 2) * (self.progress_value / 100.0))
-        self.progress_fill.setGeometry(
-            1,                  # Start from left edge + 1px border
-            1,                  # 1px from top border
-            fill_width,         # Width based on progress
-            self.height() - 2   # Height with 1px margin top and bottom
-        )
+        
+        # Repeated percentages usually map to the same pixel width; skip the
+        # repaint when nothing moved
+        if fill_width == self._last_fill_width:
+            return
+        self._last_fill_width = fill_width
+        
+        # Repaint inside the border; paintEvent draws the fill
+        self.update(1, 1, self.width() - 2, self.height() - 2)
+    
+    def paintEvent(self, event):
+        """Draw the frame, then the progress fill inside its 1px border."""
+        super().paintEvent(event)
+        if self._last_fill_width > 0:
+            painter = QPainter(self)
+            painter.fillRect(
+                1,                      # Start from left edge + 1px border
+                1,                      # 1px from top border
+                self._last_fill_width,  # Width based on progress
+                self.height() - 2,      # Height with 1px margin top and bottom
+                self._FILL_BRUSH
+            )
+            painter.end()
     
     def resizeEvent(self, event):
         """Handle resize events to update the progress fill."""
         super().resizeEvent(event)
-        # Update the progress fill when the widget is resized
+        # Update the progress fill and title elision when the widget is resized
         self.set_progress(self.progress_value)
+        if event.size().width() != event.oldSize().width():
+            self._update_title_text()
 
 class YoutubeProgress(QWidget):
     """
@@ -132,6 +206,33 @@ class YoutubeProgress(QWidget):
     cancel_requested = pyqtSignal(str)
     dismiss_requested = pyqtSignal(str)
     
+    # Error-state overrides, built once with the class rather than per call
+    ERROR_THUMBNAIL_QSS = """
+        QFrame {
+            border: 2px solid #FF3333;
+            background-color: #2A2A2A;
+        }
+    """
+    ERROR_PROGRESS_QSS = """
+        border: 1px solid #FF3333;
+        background-color: #3A1A1A;
+    """
+    ERROR_STATS_QSS = """
+        background-color: rgba(153, 0, 0, 0.85);
+        color: white;
+        padding: 3px;
+        border-radius: 2px;
+        font-size: 8pt;
+        font-weight: bold;
+    """
+    
+    # Every component has this size: 160x90 thumbnail + 20 for progress bar
+    FIXED_SIZE = QSize(160, 110)
+    
+    # Dark 160x90 pixmap shown until a thumbnail arrives, shared by every
+    # component; created with the first instance (QPixmap needs a running app)
+    _PLACEHOLDER = None
+    
     def __init__(self, url, title=None, parent=None):
         """Initialize the YouTube progress component."""
         super().__init__(parent)
@@ -141,131 +242,141 @@ class YoutubeProgress(QWidget):
         self.output_path = None
         self.downloaded_filename = None
         
-        # Set size policy
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        
-        # Create layout
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
+        # Every child has a fixed size, so they are positioned directly
+        # instead of through a layout
+        self.setFixedSize(self.FIXED_SIZE)
         
         # Create thumbnail container with relative positioning for the cancel button
-        self.thumbnail_container = QFrame()
+        self.thumbnail_container = QFrame(self)
         self.thumbnail_container.setFrameShape(QFrame.Shape.NoFrame)
-        self.thumbnail_container.setFixedSize(160, 90)  # Half the original size
-        
-        # Use absolute layout for thumbnail container
-        self.thumbnail_container.setLayout(QVBoxLayout())
-        self.thumbnail_container.layout().setContentsMargins(0, 0, 0, 0)
+        self.thumbnail_container.setGeometry(0, 0, 160, 90)  # Half the original size
         
-        # Create thumbnail label
-        self.thumbnail = QLabel()
-        self.thumbnail.setFixedSize(160, 90)
+        # Create thumbnail label; it exactly fills the fixed-size container, so
+        # it's placed directly instead of through a layout. Created before the
+        # overlays so it stays beneath them
+        self.thumbnail = QLabel(self.thumbnail_container)
+        self.thumbnail.setGeometry(0, 0, 160, 90)
         self.thumbnail.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumbnail.setStyleSheet("background-color: #2A2A2A;")
+        if YoutubeProgress._PLACEHOLDER is None:
+            placeholder = QPixmap(160, 90)
+            placeholder.fill(QColor("#2A2A2A"))
+            YoutubeProgress._PLACEHOLDER = placeholder
+        self.thumbnail.setPixmap(YoutubeProgress._PLACEHOLDER)
         self.thumbnail.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))  # Add cursor to indicate clickable
-        self.thumbnail_container.layout().addWidget(self.thumbnail)
         
         # Create cancel button as overlay
         self.cancel_button = QPushButton("×")  # Using multiplication sign as X
         self.cancel_button.setFixedSize(20, 20)  # Slightly smaller button
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 0, 0, 0.7);
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 0px 0px 3px 0px; /* Adjust padding to center the × character */
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 0.8);
-            }
-        """)
+        self.cancel_button.setObjectName("cancelBtn")
         self.cancel_button.clicked.connect(self.on_cancel_clicked)
         
         # Position cancel button at top-right of thumbnail
         self.cancel_button.setParent(self.thumbnail_container)
         self.cancel_button.move(135, 5)  # Adjust position for smaller thumbnail
         
-        # Create dismiss button for errors
-        self.dismiss_button = QPushButton("Dismiss")
-        self.dismiss_button.setFixedHeight(20)
-        self.dismiss_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(153, 0, 0, 0.8);
-                color: white;
-                border-radius: 3px;
-                font-weight: bold;
-                font-size: 8pt;
-                padding: 0px 5px;
-            }
-            QPushButton:hover {
-                background-color: rgba(204, 0, 0, 0.9);
-            }
-        """)
+        # Create dismiss button for errors, in the bottom row
+        self.dismiss_button = QPushButton("Dismiss", self)
+        self.dismiss_button.setGeometry(0, 90, 160, 20)
+        self.dismiss_button.setObjectName("dismissBtn")
         self.dismiss_button.clicked.connect(self.on_dismiss_clicked)
         self.dismiss_button.hide()  # Hidden by default
         
-        # Create title progress bar
-        self.progress_bar = TitleProgressBar()
-        self.progress_bar.setFixedWidth(160)  # Match thumbnail width
+        # Create title progress bar below the thumbnail
+        self.progress_bar = TitleProgressBar(self)
+        self.progress_bar.setGeometry(0, 90, 160, 20)  # Match thumbnail width
         
         if title:
             self.progress_bar.set_title(title)
         
-        # Create stats overlay for showing download progress details
-        self.stats_overlay = QLabel("Waiting...")
-        self.stats_overlay.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
-        self.stats_overlay.setWordWrap(True)
-        self.stats_overlay.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.7);
-            color: white;
-            padding: 3px;
-            border-radius: 2px;
-            font-size: 8pt;
-        """)
-        self.stats_overlay.setParent(self.thumbnail_container)
-        self.stats_overlay.move(4, 52)  # Adjust position for smaller thumbnail
-        self.stats_overlay.setFixedSize(152, 34)  # Adjust size proportionally
-        self.stats_overlay.hide()  # Hide initially until we have stats
-        
-        # Add widgets to layout
-        self.layout.addWidget(self.thumbnail_container)
-        self.layout.addWidget(self.progress_bar)
-        self.layout.addWidget(self.dismiss_button)
+        # Stats overlay is created on the first set_stats, since queued
+        # components usually never show it
+        self.stats_overlay = None
         
         # Initialize stats and status
         self.stats = ""
         self.status = "Queued"
+        
+        # Last status and thumbnail applied, so repeated updates are no-ops
+        self._last_status = None
+        self._thumbnail_key = None
+        
+        # Thumbnail waiting to be scaled on the next paint
+        self._pending_thumbnail = None
     
     def set_thumbnail(self, pixmap):
-        """Set the thumbnail image."""
+        """Set the thumbnail image.
+        
+        Scaling is deferred until the component is first painted, so items
+        scrolled out of the queue's viewport don't pay for it.
+        """
         if isinstance(pixmap, QPixmap):
-            # Scale pixmap to FILL the label (expanding if needed)
-            scaled_pixmap = pixmap.scaled(
-                160, 90,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,  # Changed from KeepAspectRatio
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            # If the scaled image is larger than the container, center-crop it
-            if scaled_pixmap.width() > 160 or scaled_pixmap.height() > 90:
-                x = (scaled_pixmap.width() - 160) / 2 if scaled_pixmap.width() > 160 else 0
-                y = (scaled_pixmap.height() - 90) / 2 if scaled_pixmap.height() > 90 else 0
-                scaled_pixmap = scaled_pixmap.copy(int(x), int(y), 160, 90)
-            
-            self.thumbnail.setPixmap(scaled_pixmap)
+            # Skip the scale/crop if this pixmap is already displayed or pending
+            if pixmap.cacheKey() == self._thumbnail_key:
+                return
+            self._thumbnail_key = pixmap.cacheKey()
+            self._pending_thumbnail = pixmap
+            self.update()
         elif isinstance(pixmap, str) and os.path.isfile(pixmap):
-            # Load from file path
-            self.set_thumbnail(QPixmap(pixmap))
+            # Load from file path when first painted, keyed by the path itself
+            if pixmap == self._thumbnail_key:
+                return
+            self._thumbnail_key = pixmap
+            self._pending_thumbnail = pixmap
+            self.update()
         else:
             # Reset thumbnail
-            self.thumbnail.clear()
+            self._thumbnail_key = None
+            self._pending_thumbnail = None
+            self.thumbnail.setPixmap(self._PLACEHOLDER)
+    
+    def _apply_thumbnail(self, pixmap):
+        """Scale and crop a pixmap into the thumbnail label."""
+        # Scaled thumbnails are shared through Qt's global pixmap cache, so a
+        # reused or rebuilt card showing the same source skips the rescale
+        if isinstance(pixmap, str):
+            cache_key = f"yp-thumb:{pixmap}"
+        else:
+            cache_key = f"yp-thumb:{pixmap.cacheKey()}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None:
+            self.thumbnail.setPixmap(cached)
+            return
+        
+        if isinstance(pixmap, str):
+            pixmap = QPixmap(pixmap)
+        
+        # Already thumbnail-sized (e.g. a reused component's pixmap): show as is
+        if pixmap.width() == 160 and pixmap.height() == 90:
+            self.thumbnail.setPixmap(pixmap)
+            return
+        
+        # Scale pixmap to FILL the label (expanding if needed)
+        scaled_pixmap = pixmap.scaled(
+            160, 90,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,  # Changed from KeepAspectRatio
+            Qt.TransformationMode.SmoothTransformation
+        )
+        
+        # If the scaled image is larger than the container, center-crop it
+        if scaled_pixmap.width() > 160 or scaled_pixmap.height() > 90:
+            x = (scaled_pixmap.width() - 160) // 2
+            y = (scaled_pixmap.height() - 90) // 2
+            scaled_pixmap = scaled_pixmap.copy(x, y, 160, 90)
+        
+        QPixmapCache.insert(cache_key, scaled_pixmap)
+        self.thumbnail.setPixmap(scaled_pixmap)
+    
+    def paintEvent(self, event):
+        """Apply a pending thumbnail once the component is actually on screen."""
+        if self._pending_thumbnail is not None:
+            pixmap, self._pending_thumbnail = self._pending_thumbnail, None
+            self._apply_thumbnail(pixmap)
+        super().paintEvent(event)
     
     def set_progress(self, progress):
         """Set the progress value (0-100)."""
+        if max(0, min(100, progress)) == self.progress_bar.progress_value:
+            return
         self.progress_bar.set_progress(progress)
     
     def set_title(self, title):
@@ -274,7 +385,7 @@ class YoutubeProgress(QWidget):
             return
         
         # Only update the title if we have a valid title or if current title is a loading placeholder
-        current_title = self.progress_bar.title_label.text()
+        current_title = self.progress_bar.title
         
         # If we have a real title (not a loading placeholder), always use it
         if title and not (title.startswith("Loading") or title == "Downloading..."):
@@ -297,18 +408,21 @@ class YoutubeProgress(QWidget):
     
     def set_status(self, status):
         """Set the status text and update the overlay based on status."""
+        if status == self._last_status:
+            return
+        self._last_status = status
         self.status = status
         
         # Show appropriate overlay message based on status
         if status == "Starting":
             self.set_stats("Processing started...")
-            self.dismiss_button.hide()
+            self._set_dismiss_visible(False)
         elif status == "Queued":
             self.set_stats("Waiting in queue...")
-            self.dismiss_button.hide()
+            self._set_dismiss_visible(False)
         elif status == "Complete":
             self.set_stats("Download completed")
-            self.dismiss_button.hide()
+            self._set_dismiss_visible(False)
             # Make cursor a hand to indicate clickable when completed
             self.thumbnail.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         elif status == "Error":
@@ -317,58 +431,71 @@ class YoutubeProgress(QWidget):
                 self.set_stats("Error occurred")
             
             # Show dismiss button for errors
-            self.dismiss_button.show()
+            self._set_dismiss_visible(True)
             # Reset cursor to default for error state
             self.thumbnail.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
     
+    def _create_stats_overlay(self):
+        """Create the stats overlay for showing download progress details."""
+        self.stats_overlay = QLabel(self.thumbnail_container)
+        self.stats_overlay.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom)
+        self.stats_overlay.setWordWrap(True)
+        self.stats_overlay.setObjectName("statsOverlay")
+        self.stats_overlay.move(4, 52)  # Adjust position for smaller thumbnail
+        self.stats_overlay.setFixedSize(152, 34)  # Adjust size proportionally
+    
     def set_stats(self, stats):
         """Set the stats text and show the overlay."""
         self.stats = stats
         
-        # Set text and ensure it's visible
-        self.stats_overlay.setText(stats)
-        self.stats_overlay.show()
+        if self.stats_overlay is None:
+            if not stats:
+                return
+            self._create_stats_overlay()
+        
+        # Set text and ensure it's visible; repeated status messages are
+        # common, so skip the relayout/repaint when nothing changed
+        if self.stats_overlay.text() != stats:
+            self.stats_overlay.setText(stats)
+        if self.stats_overlay.isHidden():
+            self.stats_overlay.show()
+    
+    def _set_dismiss_visible(self, visible):
+        """Show or hide the dismiss button, lifting the title bar above it when shown."""
+        self.dismiss_button.setVisible(visible)
+        # The dismiss button takes the bottom row; the title bar overlaps the
+        # thumbnail's lower edge while it is shown
+        self.progress_bar.move(0, 70 if visible else 90)
     
     def highlight_error(self):
         """Apply special styling to highlight error state."""
         # Add red border to thumbnail to visually indicate error
-        self.thumbnail_container.setStyleSheet("""
-            QFrame {
-                border: 2px solid #FF3333;
-                background-color: #2A2A2A;
-            }
-        """)
+        self.thumbnail_container.setStyleSheet(self.ERROR_THUMBNAIL_QSS)
         
         # Change progress bar to error color
-        self.progress_bar.setStyleSheet("""
-            border: 1px solid #FF3333;
-            background-color: #3A1A1A;
-        """)
+        self.progress_bar.setStyleSheet(self.ERROR_PROGRESS_QSS)
         
         # Make the error message more noticeable
-        self.stats_overlay.setStyleSheet("""
-            background-color: rgba(153, 0, 0, 0.85);
-            color: white;
-            padding: 3px;
-            border-radius: 2px;
-            font-size: 8pt;
-            font-weight: bold;
-        """)
+        if self.stats_overlay is None:
+            self._create_stats_overlay()
+        self.stats_overlay.setStyleSheet(self.ERROR_STATS_QSS)
         
         # Show dismiss button
-        self.dismiss_button.show()
+        self._set_dismiss_visible(True)
     
+    @pyqtSlot()
     def on_cancel_clicked(self):
         """Handle cancel button click."""
         self.cancel_requested.emit(self.url)
     
+    @pyqtSlot()
     def on_dismiss_clicked(self):
         """Handle dismiss button click."""
         self.dismiss_requested.emit(self.url)
     
     def sizeHint(self):
         """Return the preferred size for the widget."""
-        return QSize(160, 110)  # 160x90 thumbnail + 20 for progress bar (was 120)
+        return self.FIXED_SIZE
 
     def set_url(self, url):
         """Set the YouTube URL."""
@@ -381,48 +508,42 @@ class YoutubeProgress(QWidget):
     
     def clear(self):
         """Clear the thumbnail and progress."""
-        self.thumbnail.clear()
+        self.thumbnail.setPixmap(self._PLACEHOLDER)
         self.progress_bar.set_progress(0)
         self.stats = ""
-        self.stats_overlay.hide()
+        if self.stats_overlay is not None:
+            self.stats_overlay.hide()
         self.status = "Queued"
+        self._last_status = None
+        self._thumbnail_key = None
+        self._pending_thumbnail = None
     
-    def resizeEvent(self, event):
-        """Handle resize events to update progress indicator position."""
-        super().resizeEvent(event)
-        # Update the progress indicator position when resized
-        self.progress_bar.resizeEvent(event)
-
-    def set_url(self, url):
-        """Set the YouTube URL."""
-        if not url:
-            self.clear()
-            return
+    def reset(self, url, title=None):
+        """Reset the component so it can be reused for another URL."""
+        # Drop the previous URL's cancel/dismiss handlers
+        for signal in (self.cancel_requested, self.dismiss_requested):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
         
         self.url = url
-        # We'll let the DownloadManager handle fetching the thumbnail
-    
-    def clear(self):
-        """Clear the thumbnail and progress."""
-        self.thumbnail.clear()
-        self.progress_bar.set_progress(0)
-        self.stats = ""
-        self.stats_overlay.hide()
-        self.status = "Queued"
+        self.output_path = None
+        self.downloaded_filename = None
+        self.clear()
+        
+        # Drop any error styling left by highlight_error()
+        self.thumbnail_container.setStyleSheet("")
+        self.progress_bar.setStyleSheet("")
+        if self.stats_overlay is not None:
+            self.stats_overlay.setStyleSheet("")
+        
+        self._set_dismiss_visible(False)
+        self.thumbnail.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        
+        # Bypass set_title so a placeholder can replace the previous real title
+        self.progress_bar._show_title(title or "Loading...")
     
-    def resizeEvent(self, event):
-        """Handle resize events to scale the thumbnail."""
-        super().resizeEvent(event)
-        if hasattr(self, 'base_pixmap') and self.base_pixmap is not None:
-            # Re-scale the pixmap when the widget is resized
-            scaled_pixmap = self.base_pixmap.scaled(
-                self.thumbnail.width(),
-                self.thumbnail.height(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.set_thumbnail(scaled_pixmap)
-
     def set_output_path(self, path, filename=None):
         """Set the output path for the downloaded file."""
         self.output_path = path
@@ -1,151 +1,144 @@
 """
 Main window for the YouTube Master application.
 """
+import io
 import os
 import sys
 import time
+from contextlib import redirect_stdout
+from importlib import resources
+
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
 
 from youtubemaster.utils.logger import Logger
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox,
+    QPushButton, QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QComboBox,
     QFileDialog, QProgressBar, QStatusBar, QMessageBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QMetaObject, Q_ARG
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QSize, QMetaObject, Q_ARG
 from PyQt6.QtGui import QFont, QColor, QPalette, QIcon
 
 from youtubemaster.utils.config import config
 from youtubemaster.ui.VideoInput import VideoInput
-from youtubemaster.ui.YoutubeProgress import YoutubeProgress
+from youtubemaster.ui.YoutubeProgress import YoutubeProgress, STYLESHEET as PROGRESS_STYLESHEET
+from youtubemaster.models.ThemeManager import ThemeManager as ComponentTheme
 from youtubemaster.models.DownloadManager import DownloadManager
 from youtubemaster.ui.DownloadQueue import DownloadQueue
+from youtubemaster.services.DownloadService import strip_ansi
+
+# Dark theme stylesheet template, read once at import
+_DARK_QSS_TEMPLATE = resources.files('youtubemaster.resources').joinpath('dark.qss').read_text(encoding='utf-8')
+
+# Format option keys handed to yt-dlp unchanged when present
+_PASSTHROUGH_OPTIONS = (
+    'format_sort', 'merge_output_format', 'writesubtitles', 'writeautomaticsub',
+    'subtitleslangs', 'subtitlesformat', 'embedsubtitles', 'postprocessors',
+)
 
 class ThemeManager:
     """Manages the application theme."""
     
-    @staticmethod
-    def apply_dark_theme(app):
+    # Built (palette, stylesheet) per theme name, so re-applying a theme
+    # skips the config lookups and the stylesheet formatting
+    _qss_cache = {}
+    
+    @classmethod
+    def apply_dark_theme(cls, app):
         """Apply dark theme to the application."""
-        # Get colors from config
-        background = config.get('ui.theme.dark.background', '#1E1E1E')
-        text_color = config.get('ui.theme.dark.text', '#FFFFFF')
-        accent = config.get('ui.theme.dark.accent', '#007ACC')
-        
-        button_bg = config.get('ui.theme.dark.button.background', '#3C3C3C')
-        button_text = config.get('ui.theme.dark.button.text', '#FFFFFF')
-        button_hover = config.get('ui.theme.dark.button.hover', '#505050')
+        cached = cls._qss_cache.get('dark')
+        if cached is None:
+            cached = cls._qss_cache['dark'] = cls._build_dark_theme()
+        palette, qss = cached
         
-        input_bg = config.get('ui.theme.dark.input.background', '#3C3C3C')
-        input_text = config.get('ui.theme.dark.input.text', '#FFFFFF')
-        input_border = config.get('ui.theme.dark.input.border', '#555555')
-        
-        scrollbar_bg = config.get('ui.theme.dark.scrollbar.background', '#1E1E1E')
-        scrollbar_handle = config.get('ui.theme.dark.scrollbar.handle', '#3C3C3C')
+        # Apply palette
+        app.setPalette(palette)
         
-        # Create palette
+        # Set stylesheet for more detailed control
+        app.setStyleSheet(qss)
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop the built themes so the next apply re-reads config."""
+        cls._qss_cache.clear()
+        ComponentTheme.get_toggle_button_style.cache_clear()
+    
+    @staticmethod
+    def _build_dark_theme():
+        """Build the dark theme palette and stylesheet from config."""
+        # Get colors from config, fetching the theme subtree once and reading
+        # the keys locally
+        theme = config.get('ui.theme.dark', {}) or {}
+        button = theme.get('button') or {}
+        button_disabled = button.get('disabled') or {}
+        inputs = theme.get('input') or {}
+        scrollbar = theme.get('scrollbar') or {}
+        border_radius = theme.get('border_radius') or {}
+        
+        background = theme.get('background', '#1E1E1E')
+        text_color = theme.get('text', '#FFFFFF')
+        accent = theme.get('accent', '#007ACC')
+        
+        button_bg = button.get('background', '#3C3C3C')
+        button_text = button.get('text', '#FFFFFF')
+        button_hover = button.get('hover', '#505050')
+        button_disabled_bg = button_disabled.get('background', '#2A2A2A')
+        button_disabled_text = button_disabled.get('text', '#808080')
+        
+        input_bg = inputs.get('background', '#3C3C3C')
+        input_text = inputs.get('text', '#FFFFFF')
+        input_border = inputs.get('border', '#555555')
+        
+        scrollbar_bg = scrollbar.get('background', '#1E1E1E')
+        scrollbar_handle = scrollbar.get('handle', '#3C3C3C')
+        
+        button_radius = border_radius.get('button', '5px')
+        input_radius = border_radius.get('input', '5px')
+        
+        # The stylesheet owns widget backgrounds and text colors; the
+        # palette only carries the roles it has no rules for. The built
+        # palette is cached with the stylesheet in _qss_cache
         palette = QPalette()
-        
-        # Set colors
-        palette.setColor(QPalette.ColorRole.Window, QColor(background))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(text_color))
-        palette.setColor(QPalette.ColorRole.Base, QColor(input_bg))
         palette.setColor(QPalette.ColorRole.AlternateBase, QColor(background))
-        palette.setColor(QPalette.ColorRole.Text, QColor(input_text))
-        palette.setColor(QPalette.ColorRole.Button, QColor(button_bg))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(button_text))
         palette.setColor(QPalette.ColorRole.Highlight, QColor(accent))
         palette.setColor(QPalette.ColorRole.HighlightedText, QColor(text_color))
         
-        # Apply palette
-        app.setPalette(palette)
+        # Stylesheet for more detailed control
+        qss = (
+            _DARK_QSS_TEMPLATE % {
+                'accent': accent,
+                'background': background,
+                'button_bg': button_bg,
+                'button_disabled_bg': button_disabled_bg,
+                'button_disabled_text': button_disabled_text,
+                'button_hover': button_hover,
+                'button_radius': button_radius,
+                'button_text': button_text,
+                'input_bg': input_bg,
+                'input_border': input_border,
+                'input_radius': input_radius,
+                'input_text': input_text,
+                'scrollbar_bg': scrollbar_bg,
+                'scrollbar_handle': scrollbar_handle,
+                'text_color': text_color,
+            }
+            # Component styles ride on the same sheet so Qt parses them once
+            # instead of once per ToggleButton / progress card
+            + ComponentTheme.get_toggle_button_style('ToggleButton')
+            + PROGRESS_STYLESHEET
+        )
         
-        # Set stylesheet for more detailed control
-        app.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {background};
-                color: {text_color};
-            }}
-            
-            QWidget {{
-                background-color: {background};
-                color: {text_color};
-            }}
-            
-            QPushButton {{
-                background-color: {button_bg};
-                color: {button_text};
-                border: 1px solid {input_border};
-                padding: 5px;
-                border-radius: {config.get('ui.theme.dark.border_radius.button', '5px')};
-            }}
-            
-            QPushButton:hover {{
-                background-color: {button_hover};
-            }}
-            
-            QPushButton:pressed {{
-                background-color: {accent};
-            }}
-            
-            QPushButton:disabled {{
-                background-color: {config.get('ui.theme.dark.button.disabled.background', '#2A2A2A')};
-                color: {config.get('ui.theme.dark.button.disabled.text', '#808080')};
-            }}
-            
-            QLineEdit, QTextEdit, QComboBox {{
-                background-color: {input_bg};
-                color: {input_text};
-                border: 1px solid {input_border};
-                padding: 3px;
-                border-radius: {config.get('ui.theme.dark.border_radius.input', '5px')};
-            }}
-            
-            QProgressBar {{
-                border: 1px solid {input_border};
-                border-radius: 5px;
-                text-align: center;
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {accent};
-            }}
-            
-            QScrollBar:vertical {{
-                background-color: {scrollbar_bg};
-                width: 14px;
-                margin: 14px 0px 14px 0px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {scrollbar_handle};
-                min-height: 20px;
-                border-radius: 5px;
-                margin: 2px;
-            }}
-            
-            QScrollBar:horizontal {{
-                background-color: {scrollbar_bg};
-                height: 14px;
-                margin: 0px 14px 0px 14px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: {scrollbar_handle};
-                min-width: 20px;
-                border-radius: 5px;
-                margin: 2px;
-            }}
-        """)
+        return palette, qss
 
 class DownloadThread(QThread):
     """Worker thread for downloading videos."""
     
     # Signals for progress updates
     progress_signal = pyqtSignal(str)
-    percentage_signal = pyqtSignal(float)  # New signal for percentage updates
+    percentage_signal = pyqtSignal(int)  # Whole-percent download progress
     finished_signal = pyqtSignal(bool, str)
-    alert_signal = pyqtSignal(str)  # New signal for the alert
     
     def __init__(self, url, format_id, output_dir):
         """Initialize the download thread."""
@@ -154,90 +147,67 @@ class DownloadThread(QThread):
         self.format_id = format_id
         self.output_dir = output_dir
         self.cancelled = False
+        self._last_pct_emitted = -1  # Last percentage sent to the UI
         
-        # Initialize and set up the logger
-        try:
-            self.logger = Logger()
-            # Import config (which should be already configured)
-            from youtubemaster.utils.config import config
-            # Set up the logger with configuration
-            self.logger.setup_logger(config)
-        except Exception as e:
-            print(f"Could not initialize logger: {e}")
-            self.logger = None  # Fallback
+        # Shared logger; main() configures it once at startup
+        self.logger = Logger()
+    
+    def _progress_hook(self, d):
+        """Forward yt-dlp progress to the UI."""
+        if self.cancelled:
+            raise Exception("Download cancelled by user")
+        
+        get = d.get
+        status = d['status']
+        if status == 'downloading':
+            try:
+                # Calculate the percentage from the raw byte counts instead
+                # of parsing the formatted string
+                downloaded_bytes = get('downloaded_bytes', 0)
+                total_bytes = get('total_bytes') or get('total_bytes_estimate', 0)
+                
+                if total_bytes > 0:
+                    # Only cross the thread boundary when the whole
+                    # percent shown by the progress bar changes
+                    percentage = int((downloaded_bytes / total_bytes) * 100)
+                    if percentage != self._last_pct_emitted:
+                        self._last_pct_emitted = percentage
+                        self.percentage_signal.emit(percentage)
+                
+                # no_color keeps ANSI codes out of these strings; strip
+                # any that slip through for clean display
+                clean_percent = strip_ansi(get('_percent_str', '0%'))
+                clean_speed = strip_ansi(get('_speed_str', 'N/A'))
+                clean_eta = strip_ansi(get('_eta_str', 'N/A'))
+                
+                # Create a clean, easily parsed progress message
+                self.progress_signal.emit(f"Downloading: {clean_percent} at {clean_speed}, ETA: {clean_eta}")
+                
+            except Exception as e:
+                # If there's any error in progress reporting, log it but don't fail
+                self.logger.warning(f"Progress reporting error: {str(e)}")
+        
+        elif status == 'finished':
+            filename = get('filename', '')
+            if filename and os.path.exists(filename):
+                self.progress_signal.emit(f"Finished downloading {filename}")
     
     def run(self):
         """Run the download process."""
         try:
-            # Emit signal to show alert from main thread
-            self.alert_signal.emit(f"main_window DownloadThread invoked for URL: {self.url}")
-            
-            # Add a console log as well for additional verification
-            print("ALERT: main_window DownloadThread invoked for URL:", self.url)
-            
-            from yt_dlp import YoutubeDL
-            from yt_dlp.utils import DownloadError
-            import time
-            import os
-            import glob
-            
-            if self.logger:
-                self.logger.info(f"Starting download for: {self.url}")
+            self.logger.info(f"Starting download for: {self.url}")
             
             self.progress_signal.emit("Extracting info for: " + self.url)
             
-            # Add debug information
-            self.progress_signal.emit(f"Python version: {sys.version}")
-            self.progress_signal.emit(f"Using format: {self.format_id}")
-            self.progress_signal.emit(f"Output directory: {self.output_dir}")
+            # Debug details are only built when verbose logs are enabled
+            if config.get('ui.verbose_logs', False):
+                self.progress_signal.emit(f"Python version: {sys.version}")
+                self.progress_signal.emit(f"Using format: {self.format_id}")
+                self.progress_signal.emit(f"Output directory: {self.output_dir}")
             
             # Keep track of files before download
-            files_before = set(os.listdir(self.output_dir))
-            
-            # Modify the progress hook to capture filenames
-            def progress_hook(d):
-                if self.cancelled:
-                    raise Exception("Download cancelled by user")
-                
-                if d['status'] == 'downloading':
-                    try:
-                        # Use the raw progress data available in the dictionary
-                        # Instead of trying to parse the formatted string with ANSI codes
-                        percentage = None
-                        
-                        # Try to calculate percentage directly from bytes
-                        downloaded_bytes = d.get('downloaded_bytes', 0)
-                        total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                        
-                        if total_bytes > 0:
-                            percentage = (downloaded_bytes / total_bytes) * 100
-                            self.percentage_signal.emit(percentage)
-                        
-                        # Format a clean progress message for the log
-                        percent_str = d.get('_percent_str', '0%')
-                        speed = d.get('_speed_str', 'N/A')
-                        eta = d.get('_eta_str', 'N/A')
-                        
-                        # Remove ANSI color codes for clean display
-                        # ANSI codes follow pattern: ESC[ ... m
-                        import re
-                        clean_percent = re.sub(r'\x1b\[[0-9;]*m', '', percent_str)
-                        clean_speed = re.sub(r'\x1b\[[0-9;]*m', '', speed)
-                        clean_eta = re.sub(r'\x1b\[[0-9;]*m', '', eta)
-                        
-                        # Create a clean, easily parsed progress message
-                        progress_msg = f"Downloading: {clean_percent} at {clean_speed}, ETA: {clean_eta}"
-                        self.progress_signal.emit(progress_msg)
-                        
-                    except Exception as e:
-                        # If there's any error in progress reporting, log it but don't fail
-                        if self.logger:
-                            self.logger.warning(f"Progress reporting error: {str(e)}")
-                
-                elif d['status'] == 'finished':
-                    filename = d.get('filename', '')
-                    if filename and os.path.exists(filename):
-                        self.progress_signal.emit(f"Finished downloading {filename}")
+            with os.scandir(self.output_dir) as entries:
+                files_before = {entry.name for entry in entries}
             
             # Get format options
             format_options = self.format_id if isinstance(self.format_id, dict) else {"format": self.format_id}
@@ -246,7 +216,7 @@ class DownloadThread(QThread):
             ydl_opts = {
                 'format': format_options.get('format'),
                 'outtmpl': os.path.join(self.output_dir, '%(title)s.%(ext)s'),
-                'progress_hooks': [progress_hook],
+                'progress_hooks': [self._progress_hook],
                 'quiet': False,
                 'no_warnings': False,
                 'no_color': True,
@@ -264,36 +234,14 @@ class DownloadThread(QThread):
             # This is important to fix the PhantomJS warning and improve format extraction
             ydl_opts['extractor_args'] = format_options.get('extractor_args', {})
             
-            # Add format_sort only if it exists in format_options
-            if 'format_sort' in format_options:
-                ydl_opts['format_sort'] = format_options['format_sort']
-            
-            # If merge_output_format is set, add it to ydl_opts
-            if 'merge_output_format' in format_options:
-                ydl_opts['merge_output_format'] = format_options['merge_output_format']
-            
-            # Add subtitle options if present in format_options
-            if 'writesubtitles' in format_options:
-                ydl_opts['writesubtitles'] = format_options['writesubtitles']
-            
-            if 'writeautomaticsub' in format_options:
-                ydl_opts['writeautomaticsub'] = format_options['writeautomaticsub']
-            
-            if 'subtitleslangs' in format_options:
-                ydl_opts['subtitleslangs'] = format_options['subtitleslangs']
+            # Copy the optional yt-dlp keys the format options carry
+            ydl_opts.update({k: format_options[k] for k in _PASSTHROUGH_OPTIONS if k in format_options})
             
-            if 'subtitlesformat' in format_options:
-                ydl_opts['subtitlesformat'] = format_options['subtitlesformat']
-            
-            if 'embedsubtitles' in format_options:
-                ydl_opts['embedsubtitles'] = format_options['embedsubtitles']
-            
-            if 'postprocessors' in format_options:
-                ydl_opts['postprocessors'] = format_options['postprocessors']
-            
-            # First extract video info
+            # Extract the video info once: process=False returns the raw
+            # extractor result, which is then processed and downloaded
+            # without a second round-trip to the site
             with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
+                info = ydl.extract_info(self.url, download=False, process=False)
                 self.progress_signal.emit(f"Found video: {info.get('title', 'Unknown title')}")
                 duration_seconds = info.get('duration')
                 if duration_seconds:
@@ -303,21 +251,19 @@ class DownloadThread(QThread):
                 
                 # Start actual download
                 self.progress_signal.emit("Starting download...")
-                ydl.download([self.url])
-            
-            # Find new files after download
-            files_after = set(os.listdir(self.output_dir))
-            new_files = files_after - files_before
+                ydl.process_ie_result(info, download=True)
             
-            # Update modification time of the final files
+            # Update modification time of the new files; DirEntry.is_file uses
+            # the type scandir already read, so no extra stat per file
             current_time = time.time()
-            for filename in new_files:
-                filepath = os.path.join(self.output_dir, filename)
-                if os.path.isfile(filepath):
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.name in files_before or not entry.is_file(follow_symlinks=False):
+                        continue
                     try:
                         # Set both access time and modification time to current time
-                        os.utime(filepath, (current_time, current_time))
-                        self.progress_signal.emit(f"Updated timestamp for {filename}")
+                        os.utime(entry.path, (current_time, current_time))
+                        self.progress_signal.emit(f"Updated timestamp for {entry.name}")
                     except Exception as e:
                         self.progress_signal.emit(f"Failed to update timestamp: {str(e)}")
             
@@ -328,8 +274,7 @@ class DownloadThread(QThread):
             self.finished_signal.emit(False, f"Download failed: {str(e)}")
         except Exception as e:
             error_msg = str(e)
-            if self.logger:
-                self.logger.error(f"Error during download: {error_msg}")
+            self.logger.error(f"Error during download: {error_msg}")
             self.finished_signal.emit(False, f"Error: {error_msg}")
 
     def cancel_download(self):
@@ -346,25 +291,13 @@ class AnalyzeThread(QThread):
         """Initialize the analyze thread."""
         super().__init__()
         self.url = url
-        # Initialize logger
-        try:
-            self.logger = Logger()
-            from youtubemaster.utils.config import config
-            self.logger.setup_logger(config)
-        except Exception as e:
-            print(f"Could not initialize logger: {e}")
-            self.logger = None
+        # Shared logger; main() configures it once at startup
+        self.logger = Logger()
     
     def run(self):
         """Run the analysis process."""
         try:
-            from yt_dlp import YoutubeDL
-            from yt_dlp.utils import DownloadError
-            import io
-            from contextlib import redirect_stdout
-            
-            if self.logger:
-                self.logger.info(f"Analyzing formats for: {self.url}")
+            self.logger.info(f"Analyzing formats for: {self.url}")
             
             self.progress_signal.emit(f"Analyzing URL: {self.url}")
             
@@ -387,23 +320,22 @@ class AnalyzeThread(QThread):
             # Get the captured output and send it to the UI
             output = captured_output.getvalue()
             
-            # Split the output by lines and emit each line to show progress
-            for line in output.split('\n'):
-                if line.strip():  # Only emit non-empty lines
-                    self.progress_signal.emit(line)
+            # Send the non-empty lines as one message so the listing costs a
+            # single signal and log update instead of one per format
+            listing = "\n".join(line for line in output.split('\n') if line.strip())
+            if listing:
+                self.progress_signal.emit(listing)
             
             self.finished_signal.emit(True, "Analysis completed")
             
         except DownloadError as e:
             error_msg = str(e)
-            if self.logger:
-                self.logger.error(f"Analysis error: {error_msg}")
+            self.logger.error(f"Analysis error: {error_msg}")
             self.progress_signal.emit(f"Error: {error_msg}")
             self.finished_signal.emit(False, f"Analysis failed: {error_msg}")
         except Exception as e:
             error_msg = str(e)
-            if self.logger:
-                self.logger.error(f"Error during analysis: {error_msg}")
+            self.logger.error(f"Error during analysis: {error_msg}")
             self.progress_signal.emit(f"Error: {error_msg}")
             self.finished_signal.emit(False, f"Error: {error_msg}")
 
@@ -482,10 +414,21 @@ class MainWindow(QMainWindow):
         self.download_queue.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.main_layout.addWidget(self.download_queue)
         
+        # Log messages waiting for the next flush (~10 Hz)
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
         # Log output area with fixed height
-        self.log_output = QTextEdit()
+        # Plain text with no undo history, capped at 500 lines so long
+        # sessions don't grow the document without bound
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
-        self.log_output.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.setMaximumBlockCount(500)
+        self.log_output.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         self.log_output.setPlaceholderText("Logs will appear here...")
         self.log_output.setFixedHeight(80)  # Set fixed height (smaller than before)
         self.log_output.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)  # Fixed height policy
@@ -501,6 +444,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a valid URL.")
             return
             
+        self._log_buffer = []
         self.log_output.clear()
         self.statusBar.showMessage("Analyzing video...")
         
@@ -554,12 +498,7 @@ class MainWindow(QMainWindow):
     
     def update_progress(self, message):
         """Update the progress in the log (used for analyze thread)."""
-        self.log_output.append(message)
-        
-        # Auto-scroll to bottom
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.log_output.setTextCursor(cursor)
+        self.update_log(message)
     
     def download_finished(self, success, message):
         """Handle download completion."""
@@ -576,33 +515,26 @@ class MainWindow(QMainWindow):
         
         if success:
             self.statusBar.showMessage("Download completed")
-            self.log_output.append(message)
+            self.update_log(message)
+        elif self.download_thread and self.download_thread.cancelled:
+            self.statusBar.showMessage("Download cancelled")
+            self.update_log("Download cancelled by user")
         else:
             self.statusBar.showMessage("Download failed")
-            self.log_output.append(message)
+            self.update_log(message)
             QMessageBox.warning(self, "Download Failed", message)
     
     def on_cancel_clicked(self):
         """Handle cancel button click."""
         if self.download_thread and self.download_thread.isRunning():
-            # Terminate the thread
-            self.download_thread.terminate()
-            self.download_thread.wait()
-            
-            # Update UI
-            self.progress_bar.hide()
-            self.cancel_button.hide()
-            self.statusBar.showMessage("Download cancelled")
-            self.log_output.append("Download cancelled by user")
-            
-            # Re-enable UI elements
-            self.video_input.setEnabled(True)
-            self.output_dir_input.setEnabled(True)
-            self.download_button.setEnabled(True)
+            # Ask the thread to stop; its progress hook aborts yt-dlp on the
+            # next tick and download_finished restores the UI
+            self.download_thread.cancel_download()
+            self.statusBar.showMessage("Cancelling download...")
     
     def update_progress_bar(self, percentage):
         """Update the progress bar with actual download percentage"""
-        self.progress_bar.setValue(int(percentage))
+        self.progress_bar.setValue(percentage)
         self.youtube_progress.set_progress(percentage)
     
     def analysis_finished(self, success, message):
@@ -620,12 +552,21 @@ class MainWindow(QMainWindow):
     
     def update_log(self, message):
         """Update the log with a message."""
-        self.log_output.append(message)
+        # Buffer messages so bursts cost one append and one scroll per flush
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Append the buffered log messages and scroll to the bottom."""
+        if not self._log_buffer:
+            return
+        messages, self._log_buffer = self._log_buffer, []
+        self.log_output.appendPlainText("\n".join(messages))
         
-        # Auto-scroll to bottom
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.log_output.setTextCursor(cursor)
+        # Auto-scroll to bottom through the scrollbar, leaving the cursor alone
+        scrollbar = self.log_output.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
     
     def auto_add_download(self, url, format_type="video"):
         """
@@ -652,7 +593,7 @@ class MainWindow(QMainWindow):
                 # Legacy format - just the YouTube URL after the protocol
                 url = protocol_path
             
-            self.log_output.append(f"Processed protocol URL: {url}")
+            self.update_log(f"Processed protocol URL: {url}")
         
         # Set the URL in the input field (this will show the proper title in UI)
         self.video_input.set_url(url)
@@ -672,7 +613,7 @@ class MainWindow(QMainWindow):
         
         # Validate output directory
         if not os.path.isdir(output_dir):
-            self.log_output.append(f"Error: Invalid output directory '{output_dir}'")
+            self.update_log(f"Error: Invalid output directory '{output_dir}'")
             return False
         
         # Add to download queue
@@ -686,19 +627,13 @@ class MainWindow(QMainWindow):
             # Clear URL field for next entry
             self.video_input.set_url("")
             self.statusBar.showMessage(f"Added to download queue: {url}")
-            self.log_output.append(f"Auto-added URL to download queue: {url} ({format_type} format)")
+            self.update_log(f"Auto-added URL to download queue: {url} ({format_type} format)")
             return True
         else:
             self.statusBar.showMessage("URL already in queue")
-            self.log_output.append(f"URL already in queue: {url}")
+            self.update_log(f"URL already in queue: {url}")
             return False
 
-    # Add new method to show alert
-    def show_thread_alert(self, message):
-        """Show an alert message box."""
-        QMessageBox.information(self, "Thread Alert", message)
-        print(f"Alert shown: {message}")
-        
     # This method should be called when creating a DownloadThread
     def create_download_thread(self, url, format_id, output_dir):
         """Create and configure a download thread."""
@@ -708,6 +643,5 @@ class MainWindow(QMainWindow):
         self.download_thread.progress_signal.connect(self.update_progress)
         self.download_thread.percentage_signal.connect(self.update_progress_bar)
         self.download_thread.finished_signal.connect(self.download_finished)
-        self.download_thread.alert_signal.connect(self.show_thread_alert)
         
         return self.download_thread 
\ No newline at end of file
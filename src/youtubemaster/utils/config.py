@@ -1,17 +1,110 @@
 """
 Configuration handler for YouTubeMaster.
 """
+import atexit
+import copy
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from ruamel.yaml import YAML
 from youtubemaster.utils.env_loader import get_env
 
+# Settings that can be overridden by environment variables, with their
+# key paths pre-split. Notably excludes 'app_mode' and 'output_directory'
+_ENV_OVERRIDES = (
+    ('LOG_LEVEL', ('logging', 'level')),
+    ('LOG_FILE', ('logging', 'file')),
+    # Add any other env vars that should override config here
+    ('YOUTUBE_API_KEY', ('api', 'youtube_key')),
+)
+
+# Default configuration tree; _create_default_config returns a copy with
+# the logging settings taken from the environment
+_DEFAULT_CONFIG = {
+    "app_mode": "debug",
+    "output_directory": "downloads",
+    "logging": {
+        "level": "INFO",
+        "file": "app.log"
+    },
+    "ui": {
+        "font": {
+            "family": "Calibri",
+            "size": 10
+        },
+        "verbose_logs": False,
+        "theme": {
+            "dark": {
+                "background": "#1E1E1E",
+                "text": "#FFFFFF",
+                "accent": "#007ACC",
+                "table": {
+                    "header": "#2D2D2D",
+                    "background": "#252526",
+                    "alternate_row": "#2D2D2D",
+                    "grid": "#3C3C3C"
+                },
+                "search": {
+                    "background": "#2D2D2D",
+                    "border": "#3C3C3C",
+                    "focus": "#4CAF50"
+                },
+                "button": {
+                    "background": "#3C3C3C",
+                    "text": "#FFFFFF",
+                    "hover": "#505050",
+                    "disabled": {
+                        "background": "#2A2A2A",
+                        "text": "#808080"
+                    }
+                },
+                "input": {
+                    "background": "#3C3C3C",
+                    "text": "#FFFFFF",
+                    "border": "#555555"
+                },
+                "splitter": "#2D2D2D",
+                "titlebar": {
+                    "background": "#2D2D2D",
+                    "text": "#FFFFFF",
+                    "button_hover": "#3C3C3C"
+                },
+                "scrollbar": {
+                    "background": "#1E1E1E",
+                    "handle": "#3C3C3C",
+                    "border": "#2D2D2D",
+                    "button": "#3C3C3C",
+                    "arrow": "#555555"
+                },
+                "border_radius": {
+                    "button": "5px",
+                    "input": "5px"
+                }
+            }
+        }
+    }
+}
+
+# Home directory resolved once; the user config directory lives under it
+_HOME = Path.home()
+_USER_CONFIG_DIR = _HOME / ".youtubemaster"
+
+# Marks keys that get() could not resolve, so misses are cached too
+_MISSING = object()
+
+# Parsed config files keyed by (path, mtime, size), so reloading an
+# unchanged file skips the YAML parse
+_PARSE_CACHE = {}
+
 class Config:
     """Configuration handler for the application."""
     
     _instance = None
     
+    # Config file found by the first probe; reused while it still exists
+    _resolved_path = None
+    
     def __new__(cls):
         """Singleton pattern to ensure only one instance exists."""
         if cls._instance is None:
@@ -26,20 +119,37 @@ class Config:
             
         self._config = {}
         self._config_path = self._find_config_file()
+        
+        # Resolved get() lookups by dotted key; cleared whenever values change
+        self._get_cache = {}
+        
+        # Set when values changed without being written yet
+        self._dirty = False
+        # Depth of nested batch() blocks; saves are deferred while non-zero
+        self._batching = 0
+        
         self._load_config()
+        atexit.register(self.flush)
+        
         self._initialized = True
     
     def _find_config_file(self):
+        """Find the configuration file, probing the filesystem only once."""
+        cached = Config._resolved_path
+        if cached is not None and cached.exists():
+            return cached
+        
+        Config._resolved_path = self._probe_config_file()
+        return Config._resolved_path
+    
+    def _probe_config_file(self):
         """Find the configuration file in common locations."""
         # First, determine if we're running as frozen app (PyInstaller)
         is_frozen = getattr(sys, 'frozen', False)
         
         # First priority: Check user's config directory (always writable)
-        user_config_dir = Path.home() / ".youtubemaster"
-        if not user_config_dir.exists():
-            user_config_dir.mkdir(exist_ok=True)
-            
-        user_config = user_config_dir / "config.yaml"
+        _USER_CONFIG_DIR.mkdir(exist_ok=True)
+        user_config = _USER_CONFIG_DIR / "config.yaml"
         
         # If user config exists, use it
         if user_config.exists():
@@ -49,11 +159,10 @@ class Config:
         if sys.platform == 'win32':
             app_config_dir = Path(os.environ.get('LOCALAPPDATA', '')) / "YouTubeMaster"
         else:
-            app_config_dir = Path.home() / ".config" / "youtubemaster"
-            
-        if not app_config_dir.exists():
-            app_config_dir.mkdir(exist_ok=True, parents=True)
-            
+            app_config_dir = _HOME / ".config" / "youtubemaster"
+        
+        # mkdir with exist_ok is one call whether or not the directory exists
+        app_config_dir.mkdir(exist_ok=True, parents=True)
         app_config = app_config_dir / "config.yaml"
         
         # If App config exists, use it
@@ -84,11 +193,19 @@ class Config:
     
     def _load_config(self):
         """Load the configuration from file."""
-        yaml = YAML(typ='safe')
+        self._get_cache.clear()
         try:
             if self._config_path.exists():
-                with open(self._config_path, 'r') as file:
-                    self._config = yaml.load(file)
+                st = self._config_path.stat()
+                cache_key = (str(self._config_path), st.st_mtime_ns, st.st_size)
+                cached = _PARSE_CACHE.get(cache_key)
+                if cached is not None:
+                    self._config = copy.deepcopy(cached)
+                else:
+                    with open(self._config_path, 'r') as file:
+                        self._config = YAML(typ='safe').load(file)
+                    # Copy before env overrides touch the loaded dict
+                    _PARSE_CACHE[cache_key] = copy.deepcopy(self._config)
             
             # Apply environment variables for non-core settings
             self._apply_env_overrides()
@@ -98,88 +215,21 @@ class Config:
     
     def _apply_env_overrides(self):
         """Apply environment variable overrides for certain settings."""
-        # List of settings that can be overridden by environment variables
-        # Notably excludes 'app_mode' and 'output_directory'
-        override_map = {
-            'LOG_LEVEL': 'logging.level',
-            'LOG_FILE': 'logging.file',
-            # Add any other env vars that should override config here
-            'YOUTUBE_API_KEY': 'api.youtube_key',
-        }
-        
-        # Apply overrides
-        for env_var, config_path in override_map.items():
-            env_value = get_env(env_var)
-            if env_value is not None:
-                self.set(config_path, env_value)
+        # Apply overrides, writing the file at most once
+        with self.batch():
+            for env_var, keys in _ENV_OVERRIDES:
+                env_value = get_env(env_var)
+                if env_value is not None:
+                    self._set_keys(keys, env_value)
     
     def _create_default_config(self):
         """Create default configuration."""
         # Don't use environment variables for these core settings
         # Use fixed defaults for config.yaml instead
-        return {
-            "app_mode": "debug",
-            "output_directory": "downloads",
-            "logging": {
-                "level": get_env('LOG_LEVEL', 'INFO'),
-                "file": get_env('LOG_FILE', 'app.log')
-            },
-            "ui": {
-                "font": {
-                    "family": "Calibri",
-                    "size": 10
-                },
-                "theme": {
-                    "dark": {
-                        "background": "#1E1E1E",
-                        "text": "#FFFFFF",
-                        "accent": "#007ACC",
-                        "table": {
-                            "header": "#2D2D2D",
-                            "background": "#252526",
-                            "alternate_row": "#2D2D2D",
-                            "grid": "#3C3C3C"
-                        },
-                        "search": {
-                            "background": "#2D2D2D",
-                            "border": "#3C3C3C",
-                            "focus": "#4CAF50"
-                        },
-                        "button": {
-                            "background": "#3C3C3C",
-                            "text": "#FFFFFF",
-                            "hover": "#505050",
-                            "disabled": {
-                                "background": "#2A2A2A",
-                                "text": "#808080"
-                            }
-                        },
-                        "input": {
-                            "background": "#3C3C3C",
-                            "text": "#FFFFFF",
-                            "border": "#555555"
-                        },
-                        "splitter": "#2D2D2D",
-                        "titlebar": {
-                            "background": "#2D2D2D",
-                            "text": "#FFFFFF",
-                            "button_hover": "#3C3C3C"
-                        },
-                        "scrollbar": {
-                            "background": "#1E1E1E",
-                            "handle": "#3C3C3C",
-                            "border": "#2D2D2D",
-                            "button": "#3C3C3C",
-                            "arrow": "#555555"
-                        },
-                        "border_radius": {
-                            "button": "5px",
-                            "input": "5px"
-                        }
-                    }
-                }
-            }
-        }
+        cfg = copy.deepcopy(_DEFAULT_CONFIG)
+        cfg["logging"]["level"] = get_env('LOG_LEVEL', 'INFO')
+        cfg["logging"]["file"] = get_env('LOG_FILE', 'app.log')
+        return cfg
     
     def _save_config(self):
         """Save the configuration to file."""
@@ -197,9 +247,8 @@ class Config:
             # Check if we can write to the directory
             if is_frozen or not os.access(self._config_path.parent, os.W_OK):
                 # Save to user config directory instead
-                user_config_dir = Path.home() / ".youtubemaster"
-                user_config_dir.mkdir(exist_ok=True)
-                save_path = user_config_dir / "config.yaml"
+                _USER_CONFIG_DIR.mkdir(exist_ok=True)
+                save_path = _USER_CONFIG_DIR / "config.yaml"
                 print(f"Saving config to user directory: {save_path}")
             
             # Ensure directory exists
@@ -210,26 +259,36 @@ class Config:
                 
             # If we redirected the save, update config_path for next time
             if save_path != self._config_path:
-                self._config_path = save_path
+                self._config_path = Config._resolved_path = save_path
                 
         except Exception as e:
             print(f"Error saving configuration: {e}")
     
     def get(self, key, default=None):
         """Get a configuration value by key."""
-        keys = key.split('.')
-        value = self._config
-        
         try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._config
+            try:
+                for k in key.split('.'):
+                    value = value[k]
+            except (KeyError, TypeError):
+                value = _MISSING
+            self._get_cache[key] = value
+        
+        return default if value is _MISSING else value
+    
+    def set(self, key, value, save=True):
+        """Set a configuration value by key.
+        
+        With save=False, or inside a batch() block, the value is only
+        changed in memory until flush() writes it out.
+        """
+        self._set_keys(key.split('.'), value, save)
     
-    def set(self, key, value):
-        """Set a configuration value by key."""
-        keys = key.split('.')
+    def _set_keys(self, keys, value, save=True):
+        """Set a configuration value by its already split key path."""
         config = self._config
         
         # Navigate to the right level
@@ -238,9 +297,34 @@ class Config:
                 config[k] = {}
             config = config[k]
         
+        # Setting the current value again is a no-op, not a rewrite
+        last = keys[-1]
+        if last in config and config[last] == value:
+            return
+        
         # Set the value
-        config[keys[-1]] = value
-        self._save_config()
+        config[last] = value
+        self._get_cache.clear()
+        self._dirty = True
+        if save and not self._batching:
+            self.flush()
+    
+    def flush(self):
+        """Write pending configuration changes to file."""
+        if self._dirty:
+            self._save_config()
+            self._dirty = False
+    
+    @contextmanager
+    def batch(self):
+        """Defer saving until the outermost batch block exits."""
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching:
+                self.flush()
     
     @property
     def output_directory(self):
@@ -2,11 +2,14 @@
 Environment variables loader for YouTubeMaster.
 
 This module loads environment variables from a .env file and makes them
-available throughout the application.
+available throughout the application. The file is read on the first
+get_env() call rather than at import.
 """
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+
+# Set once the .env file has been looked for
+_loaded = False
 
 def load_environment():
     """Load environment variables from .env file."""
@@ -22,6 +25,7 @@ def load_environment():
     
     # Load the .env file if found
     if env_path.exists():
+        from dotenv import load_dotenv
         load_dotenv(dotenv_path=env_path)
         return True
     
@@ -29,7 +33,8 @@ def load_environment():
 
 def get_env(key, default=None):
     """Get environment variable with optional default value."""
+    global _loaded
+    if not _loaded:
+        load_environment()
+        _loaded = True
     return os.environ.get(key, default)
-
-# Load environment variables when the module is imported
-loaded = load_environment() 
\ No newline at end of file
@@ -20,9 +20,11 @@ Configuration:
     Logging settings (level and file path) are read from the application's config file.
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import os
+from queue import SimpleQueue
 from PyQt6.QtCore import QObject
 
 
@@ -42,6 +44,8 @@ class Logger:
         self._logger = logging.getLogger("YouTubeMaster")
 
     def setup_logger(self, config):
+        # Checks this logger's own handlers rather than hasHandlers(), which
+        # would also see root handlers added by other libraries
         if self._logger.handlers:
             return  # Logger is already set up
         log_level = config.get("logging", {}).get("level", "INFO")
@@ -50,13 +54,13 @@ class Logger:
 
         # Ensure the log directory exists
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
 
-        # Clear the log file if in debug mode
-        if app_mode == "debug":
-            with open(log_file, "w") as f:
-                f.write("")  # Clear the file
+        # Clear an existing log file if in debug mode; a missing one is
+        # created empty by the file handler anyway
+        if app_mode == "debug" and os.path.exists(log_file):
+            os.truncate(log_file, 0)
 
         # Set the logging level
         self._logger.setLevel(getattr(logging, log_level))
@@ -79,21 +83,41 @@ class Logger:
         console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
 
-        # Add handlers to the logger
-        self._logger.addHandler(console_handler)
-        self._logger.addHandler(file_handler)
-
-    def debug(self, message):
-        self._logger.debug(message)
-
-    def info(self, message):
-        self._logger.info(message)
-
-    def warning(self, message):
-        self._logger.warning(message)
-
-    def error(self, message):
-        self._logger.error(message)
-
-    def critical(self, message):
-        self._logger.critical(message)
+        # Hand records to a background listener thread that owns the real
+        # handlers, so console and file writes never block the UI thread
+        log_queue = SimpleQueue()
+        self._listener = QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+        
+        # Add the queue handler to the logger
+        self._logger.addHandler(QueueHandler(log_queue))
+
+    def shutdown(self):
+        # Flush queued records and stop the listener thread; safe to repeat
+        listener = getattr(self, "_listener", None)
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+
+    def isEnabledFor(self, level):
+        # Lets hot paths skip building messages that would be dropped
+        return self._logger.isEnabledFor(level)
+
+    # Extra args are %-formatted by logging only if the record is emitted
+    def debug(self, message, *args):
+        self._logger.debug(message, *args)
+
+    def info(self, message, *args):
+        self._logger.info(message, *args)
+
+    def warning(self, message, *args):
+        self._logger.warning(message, *args)
+
+    def error(self, message, *args):
+        self._logger.error(message, *args)
+
+    def critical(self, message, *args):
+        self._logger.critical(message, *args)
@@ -2,15 +2,124 @@
 yt-dlp wrapper - Utilities for interacting with the system-installed yt-dlp executable.
 """
 
+import copy
+import functools
+import json
 import os
+import re
 import subprocess
 import shutil
-from typing import Optional, List, Dict, Callable, Any
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Callable, Any, Union
+
+# Common install locations probed alongside a PATH search
+_YT_DLP_PATHS = (
+    r"C:\windows\system32\yt-dlp.exe",
+    os.path.join(os.environ.get("APPDATA", ""), "yt-dlp", "yt-dlp.exe"),
+    os.path.join(os.path.expanduser("~"), "yt-dlp", "yt-dlp.exe"),
+)
+_FFMPEG_PATHS = (
+    r"C:\windows\system32\ffmpeg.exe",
+    r"C:\ffmpeg\bin\ffmpeg.exe",
+    os.path.join(os.environ.get("APPDATA", ""), "ffmpeg", "bin", "ffmpeg.exe"),
+)
+
+# Progress line format parsed by YtDlpWrapper._PROGRESS_RE
+PROGRESS_TEMPLATE = (
+    "[yt-dlp],%(progress._percent_str)s,%(progress._eta_str)s,%(progress.downloaded_bytes)s,"
+    "%(progress.total_bytes)s,%(progress.speed)s,%(progress.eta)s"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_yt_dlp() -> str:
+    """
+    Find the yt-dlp executable on the system.
+    
+    The result is cached, so only the first wrapper probes the filesystem.
+    
+    Returns:
+        The path to the yt-dlp executable.
+        
+    Raises:
+        FileNotFoundError: If yt-dlp cannot be found.
+    """
+    # Check common locations
+    for path in _YT_DLP_PATHS:
+        if os.path.isfile(path):
+            return path
+            
+    # Check PATH
+    yt_dlp_path = shutil.which("yt-dlp")
+    if yt_dlp_path:
+        return yt_dlp_path
+        
+    raise FileNotFoundError(
+        "yt-dlp executable not found. Please make sure it's installed and available in your PATH."
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> Optional[str]:
+    """
+    Find the ffmpeg executable on the system.
+    
+    The result is cached, so only the first wrapper probes the filesystem.
+    
+    Returns:
+        The path to the ffmpeg executable, or None if not found.
+    """
+    # Check PATH
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        return ffmpeg_path
+        
+    # Check common locations
+    for path in _FFMPEG_PATHS:
+        if os.path.isfile(path):
+            return path
+            
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _yt_dlp_version(yt_dlp_path: str) -> str:
+    """
+    Run `yt-dlp --version` for the given executable.
+    
+    Cached per path, since the version only changes when the binary does.
+    
+    Returns:
+        The version string.
+    """
+    result = subprocess.run(
+        [yt_dlp_path, "--version"], 
+        capture_output=True, 
+        text=True, 
+        check=True
+    )
+    return result.stdout.strip()
+
 
 
 class YtDlpWrapper:
     """Wrapper for the yt-dlp executable."""
     
+    # Matches the lines produced by PROGRESS_TEMPLATE
+    # (bytes pattern: output is matched before it is decoded)
+    _PROGRESS_RE = re.compile(
+        rb'^\[yt-dlp\],([^,]*),([^,]*),([^,]*),([^,]*),([^,]*),([^,]*)$'
+    )
+    # Line breaks in yt-dlp output, including the bare \r of progress updates
+    _LINE_SPLIT_RE = re.compile(rb'\r\n|\r|\n')
+    _PROGRESS_FIELDS = ('percent', 'eta_str', 'downloaded_bytes', 'total_bytes', 'speed', 'eta')
+    
+    # Seconds a --dump-json result is reused before yt-dlp is run again
+    INFO_CACHE_TTL = 60
+    # Most URLs kept in a wrapper's info cache (oldest dropped first)
+    INFO_CACHE_SIZE = 32
+    
     def __init__(self, path: Optional[str] = None):
         """
         Initialize the yt-dlp wrapper.
@@ -19,85 +128,45 @@ class YtDlpWrapper:
             path: Optional path to the yt-dlp executable. If None, the wrapper
                  will search in common locations.
         """
-        self.yt_dlp_path = path or self._find_yt_dlp()
-        self.ffmpeg_path = self._find_ffmpeg()
-        
-    def _find_yt_dlp(self) -> str:
-        """
-        Find the yt-dlp executable on the system.
+        self.yt_dlp_path = path or _find_yt_dlp()
+        self.ffmpeg_path = _find_ffmpeg()
         
-        Returns:
-            The path to the yt-dlp executable.
-            
-        Raises:
-            FileNotFoundError: If yt-dlp cannot be found.
-        """
-        # Check common locations
-        common_paths = [
-            r"C:\windows\system32\yt-dlp.exe",
-            os.path.join(os.environ.get("APPDATA", ""), "yt-dlp", "yt-dlp.exe"),
-            os.path.join(os.path.expanduser("~"), "yt-dlp", "yt-dlp.exe")
-        ]
+        # Arguments shared by every execute() call, built once
+        self._cmd_prefix = [self.yt_dlp_path, "--progress-template", PROGRESS_TEMPLATE]
+        if self.ffmpeg_path:
+            self._cmd_prefix.extend(["--ffmpeg-location", self.ffmpeg_path])
         
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-                
-        # Check PATH
-        yt_dlp_path = shutil.which("yt-dlp")
-        if yt_dlp_path:
-            return yt_dlp_path
-            
-        raise FileNotFoundError(
-            "yt-dlp executable not found. Please make sure it's installed and available in your PATH."
-        )
+        # url -> (monotonic time fetched, info dict)
+        self._info_cache = OrderedDict()
         
-    def _find_ffmpeg(self) -> Optional[str]:
+    def get_version(self) -> str:
         """
-        Find the ffmpeg executable on the system.
+        Get the version of yt-dlp.
+        
+        The version is queried once per executable and cached; call
+        refresh_version() after updating yt-dlp.
         
         Returns:
-            The path to the ffmpeg executable, or None if not found.
+            The version string.
         """
-        # Check PATH
-        ffmpeg_path = shutil.which("ffmpeg")
-        if ffmpeg_path:
-            return ffmpeg_path
-            
-        # Check common locations
-        common_paths = [
-            r"C:\windows\system32\ffmpeg.exe",
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            os.path.join(os.environ.get("APPDATA", ""), "ffmpeg", "bin", "ffmpeg.exe")
-        ]
+        return _yt_dlp_version(self.yt_dlp_path)
         
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
-        
-    def get_version(self) -> str:
+    def refresh_version(self) -> str:
         """
-        Get the version of yt-dlp.
+        Drop the cached yt-dlp versions and query this executable again.
         
         Returns:
             The version string.
         """
-        result = subprocess.run(
-            [self.yt_dlp_path, "--version"], 
-            capture_output=True, 
-            text=True, 
-            check=True
-        )
-        return result.stdout.strip()
+        _yt_dlp_version.cache_clear()
+        return self.get_version()
         
     def execute(self, 
                 url: str, 
                 output_template: str = "%(title)s.%(ext)s", 
                 format_code: Optional[str] = None,
                 options: Optional[Dict[str, Any]] = None,
-                progress_callback: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+                progress_callback: Optional[Callable[[Union[str, Dict[str, str]]], None]] = None) -> subprocess.CompletedProcess:
         """
         Execute yt-dlp with the given parameters.
         
@@ -107,37 +176,27 @@ class YtDlpWrapper:
             format_code: The format code to download.
             options: Additional options to pass to yt-dlp.
             progress_callback: Optional callback function to track progress.
+                Progress lines are passed as a dict keyed by field name
+                (percent, eta_str, downloaded_bytes, total_bytes, speed,
+                eta); any other output line is passed as a string.
             
         Returns:
             The completed process object.
         """
-        cmd = [self.yt_dlp_path]
-        
-        # Add output template
-        cmd.extend(["--output", output_template])
+        # Start from the prefix with the executable, progress template and ffmpeg path
+        cmd = [*self._cmd_prefix, "--output", output_template]
         
         # Add format if specified
         if format_code:
             cmd.extend(["--format", format_code])
             
-        # Add ffmpeg path if found
-        if self.ffmpeg_path:
-            cmd.extend(["--ffmpeg-location", self.ffmpeg_path])
-            
-        # Add custom progress format for parsing
-        cmd.extend([
-            "--progress-template", 
-            "[yt-dlp],%(progress._percent_str)s,%(progress._eta_str)s,%(progress.downloaded_bytes)s,%(progress.total_bytes)s,%(progress.speed)s,%(progress.eta)s"
-        ])
-            
-        # Add any additional options
+        # Add any additional options: True is a bare flag, False is skipped
         if options:
-            for key, value in options.items():
-                if value is True:
-                    # Flag without value
-                    cmd.append(f"--{key}")
-                elif value is not False:  # Skip False values
-                    cmd.extend([f"--{key}", str(value)])
+            cmd += [
+                arg
+                for key, value in options.items() if value is not False
+                for arg in ((f"--{key}",) if value is True else (f"--{key}", str(value)))
+            ]
                     
         # Add the URL
         cmd.append(url)
@@ -149,14 +208,25 @@ class YtDlpWrapper:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1  # Line buffered
+                bufsize=0  # Unbuffered; output is read in large chunks below
             )
             
-            # Process output lines
-            for line in iter(process.stdout.readline, ''):
-                if progress_callback:
-                    progress_callback(line.strip())
+            # Read the raw pipe in large chunks and split lines ourselves,
+            # decoding each line once after the progress match
+            fd = process.stdout.fileno()
+            split_lines = self._LINE_SPLIT_RE.split
+            pending = b''
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                lines = split_lines(pending + chunk)
+                pending = lines.pop()  # Incomplete last line
+                for line in lines:
+                    self._emit_line(line, progress_callback)
+            if pending:
+                self._emit_line(pending, progress_callback)
+            process.stdout.close()
                     
             process.wait()
             return subprocess.CompletedProcess(cmd, process.returncode, "", "")
@@ -164,72 +234,85 @@ class YtDlpWrapper:
             # Simple execution without progress tracking
             return subprocess.run(cmd, capture_output=True, text=True)
             
+    def _emit_line(self, line: bytes, progress_callback: Callable[[Union[str, Dict[str, str]]], None]) -> None:
+        """
+        Pass one raw output line to the progress callback.
+        
+        Progress lines become a dict of decoded fields; any other line is
+        decoded and stripped.
+        """
+        line = line.strip()
+        m = self._PROGRESS_RE.match(line)
+        if m:
+            progress_callback({
+                field: value.decode('utf-8', 'replace')
+                for field, value in zip(self._PROGRESS_FIELDS, m.groups())
+            })
+        else:
+            progress_callback(line.decode('utf-8', 'replace'))
+            
     def get_formats(self, url: str) -> List[Dict[str, str]]:
         """
         Get available formats for a URL.
         
+        Reads the formats from extract_video_info(), so asking for both
+        formats and metadata only runs yt-dlp once.
+        
         Args:
             url: The URL to check.
             
         Returns:
             A list of available formats with their details.
         """
-        result = subprocess.run(
-            [self.yt_dlp_path, "-F", url],
-            capture_output=True,
-            text=True
-        )
+        info = self.extract_video_info(url)
         
-        formats = []
-        lines = result.stdout.strip().split('\n')
-        
-        # Skip header lines
-        for line in lines:
-            if line.startswith('ID') or line.startswith('-'):
-                continue
-                
-            # Parse format lines
-            try:
-                parts = line.split()
-                if len(parts) >= 3:
-                    format_id = parts[0]
-                    extension = parts[1]
-                    
-                    # Handle format description (may contain spaces)
-                    resolution = parts[2]
-                    note = ' '.join(parts[3:]) if len(parts) > 3 else ''
-                    
-                    formats.append({
-                        'format_id': format_id,
-                        'extension': extension,
-                        'resolution': resolution,
-                        'note': note,
-                        'full_line': line
-                    })
-            except Exception:
-                # Skip lines that don't parse correctly
-                pass
-                
-        return formats
+        return [
+            {
+                'format_id': fmt.get('format_id', ''),
+                'extension': fmt.get('ext', ''),
+                'resolution': fmt.get('resolution') or '',
+                'note': fmt.get('format_note') or '',
+                'full_line': fmt.get('format', ''),
+            }
+            for fmt in info.get('formats') or ()
+        ]
 
     def extract_video_info(self, url: str) -> Dict[str, Any]:
         """
         Extract video information from a URL.
         
+        Successful results are cached for INFO_CACHE_TTL seconds; callers
+        always get their own copy.
+        
         Args:
             url: The URL to extract information from.
             
         Returns:
             A dictionary containing video information.
         """
+        now = time.monotonic()
+        cached = self._info_cache.get(url)
+        if cached is not None:
+            if now - cached[0] < self.INFO_CACHE_TTL:
+                return copy.deepcopy(cached[1])
+            del self._info_cache[url]
+        
         result = subprocess.run(
-            [self.yt_dlp_path, "--dump-json", url],
+            [self.yt_dlp_path, "--dump-json", "--no-playlist", url],
             capture_output=True,
             text=True
         )
         
-        import json
+        # --no-playlist keeps watch?v=...&list=... URLs to the one video; a
+        # pure playlist URL still prints one JSON object per entry, so only
+        # the first line is parsed
+        first_line = result.stdout.split('\n', 1)[0]
         try:
-            return json.loads(result.stdout)
+            info = json.loads(first_line)
         except json.JSONDecodeError:
-            return {"error": "Failed to parse video information"} 
\ No newline at end of file
+            return {"error": "Failed to parse video information"}
+        
+        self._info_cache[url] = (now, info)
+        if len(self._info_cache) > self.INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        return copy.deepcopy(info)
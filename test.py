@@ -1,48 +1,103 @@
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-def run_ytdlp_test():
-    # Test URL
-    url = "https://www.youtube.com/watch?v=0ahIpX6H2Fw"
-    
-    # Format string matching our Yt_DlpModel logic for 1080p without AV1 codec
-    format_str = "bestvideo[height<=1080][vcodec!*=av01]+bestaudio[ext=m4a]/best[height<=1080][vcodec!*=av01]"
-    
-    # Construct the yt-dlp command
-    cmd = [
-        "yt-dlp",
-        "--format", format_str,
-        "--verbose",  # Show detailed output
-        "--progress",  # Show download progress
-        "--cookies-from-browser", "firefox",  # Use Firefox cookies for authentication
-        url
-    ]
+# Test URL
+TEST_URL = "https://www.youtube.com/watch?v=0ahIpX6H2Fw"
+
+# Format string matching our Yt_DlpModel logic for 1080p without AV1 codec
+FORMAT_STR = "bestvideo[height<=1080][vcodec!*=av01]+bestaudio[ext=m4a]/best[height<=1080][vcodec!*=av01]"
+
+# yt-dlp resolved on PATH once, so each launch skips the PATH search
+YTDLP = shutil.which("yt-dlp") or "yt-dlp"
+
+# The yt-dlp command without the cookie options and URL
+CMD = (
+    YTDLP,
+    "--format", FORMAT_STR,
+    # One compact line per progress update
+    "--newline",
+    "--progress-template", "download:%(progress._percent_str)s at %(progress._speed_str)s",
+)
+if os.environ.get("YTDLP_DEBUG"):
+    CMD += ("--verbose",)  # Show detailed output
+
+# Firefox cookies exported by an earlier run, reused for up to an hour
+COOKIE_JAR = "cookies.txt"
+COOKIE_MAX_AGE = 60 * 60
+
+def _cookie_args():
+    """Return the yt-dlp cookie options, reusing a recent cookie jar."""
+    try:
+        fresh = time.time() - os.path.getmtime(COOKIE_JAR) < COOKIE_MAX_AGE
+    except OSError:
+        fresh = False
+    if fresh:
+        return ("--cookies", COOKIE_JAR)
+    # Use Firefox cookies for authentication; yt-dlp also saves them to the
+    # jar on exit so the next runs skip reading the browser store
+    return ("--cookies-from-browser", "firefox", "--cookies", COOKIE_JAR)
+
+def _pump_output(fd):
+    """Copy a child's output pipe to our stdout until EOF."""
+    # Pass the raw output through in pipe-sized chunks instead of
+    # decoding and printing it line by line
+    sys.stdout.flush()  # Send pending print() text before the raw bytes
+    out = sys.stdout.buffer
+    # Only a terminal needs each chunk shown right away; redirected
+    # output is left to block buffering and flushed once at the end
+    interactive = sys.stdout.isatty()
+    if not interactive and hasattr(os, "splice"):
+        # Linux: move redirected output pipe-to-file inside the kernel
+        try:
+            dst = sys.stdout.fileno()
+            while os.splice(fd, dst, 1 << 16):
+                pass
+        except OSError:
+            pass  # e.g. an append-mode target; copy the rest below
+    while True:
+        data = os.read(fd, 1 << 16)
+        if not data:
+            break
+        out.write(data)
+        if interactive:
+            out.flush()
+    out.flush()
+
+def run_ytdlp_test(url=TEST_URL, capture=False, log_path=None):
+    """Run yt-dlp on one URL; capture=True pipes its output through us, log_path writes it to a file."""
+    cmd = (*CMD, *_cookie_args(), url)
     
-    print(f"Running command: {' '.join(cmd)}\n")
+    print("Running command:", shlex.join(cmd), end="\n\n")
     print("=" * 80)
     
     try:
-        # Run the command and stream output in real-time
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Stream the output in real-time
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                print(output.strip())
-                sys.stdout.flush()  # Force flush to show output immediately
+        if log_path:
+            # The kernel connects yt-dlp's output to the file; follow it
+            # with tail -f for live progress
+            with open(log_path, "wb") as log:
+                return_code = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT).returncode
+            print(f"Output written to {log_path}")
+        elif capture:
+            # Run the command and stream output in real-time
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0
+            )
+            _pump_output(process.stdout.fileno())
+            return_code = process.wait()
+        else:
+            # The child shares our stdout, so there is nothing to copy and
+            # yt-dlp renders its own progress on a terminal
+            sys.stdout.flush()
+            return_code = subprocess.run(cmd, stderr=subprocess.STDOUT).returncode
         
-        # Get return code
-        return_code = process.poll()
         print("=" * 80)
         print(f"\nProcess finished with return code: {return_code}")
         
@@ -51,5 +106,25 @@ def run_ytdlp_test():
     except Exception as e:
         print(f"Unexpected error: {e}")
 
+def run_many(urls, workers=4):
+    """Run yt-dlp on several URLs concurrently, logging each to ytdlp_<n>.log."""
+    # Decide the cookie source once; concurrent runs must not all write the
+    # jar, so a stale jar means every run reads Firefox directly
+    cookies = _cookie_args()
+    if "--cookies-from-browser" in cookies:
+        cookies = ("--cookies-from-browser", "firefox")
+    
+    def run_one(job):
+        index, url = job
+        # The child writes straight into its log file; no Python read loop
+        with open(f"ytdlp_{index}.log", "wb") as log:
+            return subprocess.run(
+                (*CMD, *cookies, url), stdout=log, stderr=subprocess.STDOUT
+            ).returncode
+    
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(run_one, enumerate(urls)))
+
 if __name__ == "__main__":
-    run_ytdlp_test() 
\ No newline at end of file
+    # Optional argument: a file to write yt-dlp's output to
+    run_ytdlp_test(log_path=sys.argv[1] if len(sys.argv) > 1 else None)